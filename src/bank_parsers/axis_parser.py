@@ -1,52 +1,81 @@
 import logging
 import re
+import sys
 from typing import List
+import numpy as np
+import pandas as pd
 import pdfplumber
 from .base_parser import BaseParser
 from models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Single interned bank-name object shared by every Transaction
+_BANK = sys.intern("Axis")
+
+# Pre-compiled patterns - compiling once at import avoids the per-call
+# cache lookup in the re module on every statement line.
+# Date and amount are matched in a single pass; the description is sliced
+# out around the match spans instead of re-scanning the line.
+_LINE_RE = re.compile(r'(?P<date>\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b).*?(?P<amt>(?:Rs\.?|INR)?\s*[\d,]+\.?\d*\s*(?:Dr|Cr)?)')
+
+# Tokens that mark a table as containing transactions - checked via set
+# intersection instead of scanning the joined header string per indicator
+_TXN_KEYWORDS = frozenset({
+    'date', 'transaction', 'amount',
+    'merchant', 'category', 'description', 'particulars', 'details'
+})
+
+# Below this row count the pandas call overhead outweighs the vectorized
+# date parsing win, so small tables stay on the per-row path
+_VECTORIZE_MIN_ROWS = 20
+
 class AxisParser(BaseParser):
     def __init__(self):
-        super().__init__("Axis")
+        super().__init__(_BANK)
     
     def parse_pdf(self, pdf: pdfplumber.PDF) -> List[Transaction]:
-        transactions = []
-        
         try:
-            for page_num, page in enumerate(pdf.pages):
-                tables = page.extract_tables()
-                
-                for table in tables:
-                    if self._is_transaction_table(table):
-                        page_transactions = self._parse_transaction_table(table)
-                        transactions.extend(page_transactions)
-                        
-                if not tables:
-                    text_transactions = self._parse_text_format(page)
-                    transactions.extend(text_transactions)
-                    
+            transactions = self.parse_pages_in_parallel(pdf)
+
             logger.info(f"Axis parser extracted {len(transactions)} transactions")
-            return [t for t in transactions if self.validate_transaction(t)]
-            
+            # Each _parse_* helper already validates before appending, so no
+            # second validation pass is needed here
+            return transactions
+
         except Exception as e:
             logger.error(f"Axis parser failed: {str(e)}")
             return []
+
+    def _parse_page(self, page) -> List[Transaction]:
+        transactions = []
+
+        # Pull the text first (cheap relative to table extraction) and skip
+        # obvious non-transaction pages before any layout analysis
+        text = self.extract_page_text(page) or ""
+        if not self.has_date_hint(text):
+            return transactions
+
+        tables = self.extract_page_tables(page)
+
+        for table in tables:
+            if self._is_transaction_table(table):
+                page_transactions = self._parse_transaction_table(table)
+                transactions.extend(page_transactions)
+
+        if not tables:
+            text_transactions = self._parse_text_format(text)
+            transactions.extend(text_transactions)
+
+        return transactions
     
     def _is_transaction_table(self, table: List[List[str]]) -> bool:
         if not table or len(table) < 2:
             return False
-            
-        headers = [cell.lower() if cell else "" for cell in table[0]]
-        header_text = ' '.join(headers)
-        
-        # Check for transaction table indicators
-        transaction_indicators = [
-            'date', 'transaction details', 'transaction', 'amount', 
-            'merchant category', 'description', 'particulars'
-        ]
-        return any(indicator in header_text for indicator in transaction_indicators)
+
+        # Tokenize the header cells once and intersect with the keyword set
+        header_words = {word for cell in table[0] if cell for word in cell.lower().split()}
+        return bool(header_words & _TXN_KEYWORDS)
     
     def _parse_transaction_table(self, table: List[List[str]]) -> List[Transaction]:
         transactions = []
@@ -59,77 +88,137 @@ class AxisParser(BaseParser):
                 return transactions
             
             headers = [cell.lower().strip() if cell else "" for cell in table[header_row_idx]]
-            
-            date_col = self._find_column_index(headers, ['date', 'transaction date', 'txn date'])
-            desc_col = self._find_column_index(headers, ['transaction details', 'description', 'particulars', 'details'])
-            amount_col = self._find_column_index(headers, ['amount', 'debit', 'credit', 'txn amount'])
-            ref_col = self._find_column_index(headers, ['reference', 'ref no', 'transaction id', 'txn id'])
+
+            # Build the token -> column reverse index once, then each
+            # keyword lookup is a hash hit instead of a substring scan
+            header_index = self._build_header_index(headers)
+
+            date_col = self._find_column(header_index, ('date', 'transaction date', 'txn date'))
+            desc_col = self._find_column(header_index, ('transaction details', 'description', 'particulars', 'details'))
+            amount_col = self._find_column(header_index, ('amount', 'debit', 'credit', 'txn amount'))
+            ref_col = self._find_column(header_index, ('reference', 'ref no', 'transaction id', 'txn id'))
             
             logger.info(f"Found columns - Date: {date_col}, Desc: {desc_col}, Amount: {amount_col}, Ref: {ref_col}")
             
-            # Process data rows starting after the header row
-            for row_idx in range(header_row_idx + 1, len(table)):
-                row = table[row_idx]
-                if len(row) <= max(date_col, desc_col, amount_col) if date_col >= 0 and desc_col >= 0 and amount_col >= 0 else 0:
-                    continue
-                    
-                if date_col >= 0 and desc_col >= 0 and amount_col >= 0:
-                    date_str = row[date_col] if date_col < len(row) else ""
-                    description = row[desc_col] if desc_col < len(row) else ""
-                    amount_str = row[amount_col] if amount_col < len(row) else ""
-                    ref_no = row[ref_col] if ref_col >= 0 and ref_col < len(row) else ""
-                    
+            # Pass 1: collect raw fields from data rows after the header row.
+            # The column checks are loop-invariant, so resolve them once
+            # instead of rebuilding a max() per row.
+            parsed_rows = []
+            if date_col >= 0 and desc_col >= 0 and amount_col >= 0:
+                required_max = max(date_col, desc_col, amount_col)
+                for row_idx in range(header_row_idx + 1, len(table)):
+                    row = table[row_idx]
+                    if len(row) <= required_max:
+                        continue
+
+                    date_str = row[date_col]
+                    description = row[desc_col]
+                    amount_str = row[amount_col]
+                    ref_no = row[ref_col] if 0 <= ref_col < len(row) else ""
+
                     if date_str and description and amount_str:
-                        try:
-                            transaction = Transaction(
-                                date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                                bank="Axis",
-                                txn_id=ref_no or f"AXIS_{date_str}_{len(transactions)}",
-                                description=self.clean_description(description),
-                                amount=self.normalize_amount(amount_str)
-                            )
-                            
-                            if self.validate_transaction(transaction):
-                                transactions.append(transaction)
-                                
-                        except Exception as e:
-                            logger.warning(f"Failed to parse row {row}: {str(e)}")
+                        parsed_rows.append((date_str, description, amount_str, ref_no))
+
+            # Normalize dates and amounts in single vectorized passes for
+            # big tables; per-row parsing only pays off below the threshold
+            normalized_dates = self._normalize_dates(parsed_rows)
+            normalized_amounts = self._normalize_amounts(parsed_rows)
+
+            # Pass 2: build the transactions
+            for (date_str, description, amount_str, ref_no), normalized_date, amount in zip(parsed_rows, normalized_dates, normalized_amounts):
+                try:
+                    transaction = Transaction(
+                        date=normalized_date,
+                        bank=_BANK,
+                        txn_id=ref_no or f"AXIS_{date_str}_{len(transactions)}",
+                        description=self.clean_description(description),
+                        amount=amount
+                    )
+
+                    if self.validate_transaction(transaction):
+                        transactions.append(transaction)
+
+                except Exception as e:
+                    logger.warning(f"Failed to parse row {(date_str, description, amount_str)}: {str(e)}")
             
         except Exception as e:
             logger.error(f"Failed to parse Axis transaction table: {str(e)}")
             
         return transactions
     
-    def _parse_text_format(self, page) -> List[Transaction]:
+    def _normalize_dates(self, parsed_rows: List[tuple]) -> List[str]:
+        """Normalize the date column of collected rows, vectorizing via
+        pandas when the table is large enough to amortize the call"""
+        date_strs = [row[0] for row in parsed_rows]
+
+        if len(date_strs) < _VECTORIZE_MIN_ROWS:
+            return [self.normalize_date(date_str, "DD/MM/YYYY") for date_str in date_strs]
+
+        normalized = pd.to_datetime(
+            pd.Series(date_strs), format='%d/%m/%Y', errors='coerce'
+        ).dt.strftime('%Y-%m-%d')
+
+        # Unparseable dates come back as NaT; fall back to the raw string
+        # to match normalize_date's failure behaviour
+        return [
+            normalized_date if isinstance(normalized_date, str) else date_str
+            for normalized_date, date_str in zip(normalized, date_strs)
+        ]
+
+    def _normalize_amounts(self, parsed_rows: List[tuple]) -> List[float]:
+        """Normalize the amount column of collected rows, vectorizing via
+        numpy when the table is large enough to amortize the array setup"""
+        amount_strs = [row[2] for row in parsed_rows]
+
+        if len(amount_strs) < _VECTORIZE_MIN_ROWS:
+            return [self.normalize_amount(amount_str) for amount_str in amount_strs]
+
+        try:
+            arr = np.asarray(amount_strs, dtype=str)
+            # 'Credit' contains 'Cr', so one search covers both markers
+            is_credit = np.char.find(arr, 'Cr') >= 0
+            is_debit = np.char.find(arr, 'Dr') >= 0
+
+            for token in ('Credit', 'Cr', 'Debit', 'Dr', 'INR', ','):
+                arr = np.char.replace(arr, token, '')
+            values = np.char.strip(arr).astype(np.float64)
+
+            # Mirror normalize_amount's sign convention: credits negative,
+            # debits positive, unmarked amounts kept as-is
+            return list(np.where(is_credit, -np.abs(values),
+                                 np.where(is_debit, np.abs(values), values)))
+        except ValueError:
+            # A malformed cell poisons the whole array cast, so fall back
+            # to the per-row path that logs and zeroes just that row
+            return [self.normalize_amount(amount_str) for amount_str in amount_strs]
+
+    def _parse_text_format(self, text: str) -> List[Transaction]:
         transactions = []
-        
+
         try:
-            text = page.extract_text()
             if not text:
                 return transactions
-            
-            date_pattern = r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b'
-            amount_pattern = r'(?:Rs\.?|INR)?\s*([\d,]+\.?\d*)\s*(?:Dr|Cr)?'
-            
+
             lines = text.split('\n')
-            
+
             for line in lines:
-                date_match = re.search(date_pattern, line)
-                amount_match = re.search(amount_pattern, line)
-                
-                if date_match and amount_match:
-                    date_str = date_match.group(1)
-                    amount_str = amount_match.group(0)
-                    
-                    description = line.strip()
-                    description = re.sub(date_pattern, '', description)
-                    description = re.sub(amount_pattern, '', description)
+                match = _LINE_RE.search(line)
+
+                if match:
+                    date_str = match.group('date')
+                    amount_str = match.group('amt')
+
+                    # Slice the description out around the matched spans
+                    # instead of running two more regex substitutions
+                    description = (line[:match.start('date')] +
+                                   line[match.end('date'):match.start('amt')] +
+                                   line[match.end('amt'):])
                     description = self.clean_description(description)
                     
                     if description:
                         transaction = Transaction(
                             date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                            bank="Axis",
+                            bank=_BANK,
                             txn_id=f"AXIS_TEXT_{date_str}_{len(transactions)}",
                             description=description,
                             amount=self.normalize_amount(amount_str)
@@ -143,11 +232,21 @@ class AxisParser(BaseParser):
             
         return transactions
     
-    def _find_column_index(self, headers: List[str], keywords: List[str]) -> int:
+    def _build_header_index(self, headers: List[str]) -> dict:
+        """Map each full header and each of its tokens to the first column
+        they appear in"""
+        index = {}
         for i, header in enumerate(headers):
-            for keyword in keywords:
-                if keyword in header:
-                    return i
+            if header:
+                index.setdefault(header, i)
+                for token in header.split():
+                    index.setdefault(token, i)
+        return index
+
+    def _find_column(self, header_index: dict, keywords: tuple) -> int:
+        for keyword in keywords:
+            if keyword in header_index:
+                return header_index[keyword]
         return -1
     
     def _find_header_row(self, table: List[List[str]]) -> int:
@@ -1,5 +1,6 @@
 import logging
 import re
+import sys
 from typing import List
 import pdfplumber
 from .base_parser import BaseParser
@@ -7,33 +8,88 @@ from models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Single interned bank-name object shared by every Transaction
+_BANK = sys.intern("HDFC")
+
+# Pre-compiled patterns - compiling once at import avoids the per-call
+# cache lookup in the re module on every statement line
+# MULTILINE lets one finditer pass walk the whole page text instead of a
+# Python-level loop over split lines; ASCII skips Unicode class lookups.
+# Whitespace inside the pattern is [ \t] so matches never cross lines.
+_HDFC_LINE_RE = re.compile(r'^[ \t]*(\d{1,2}/\d{1,2}/\d{4})(?:\|[ \t]*\d{2}:\d{2})?[ \t]+(.+?)[ \t]+((?:C[ \t]*)?[\d,]+\.?\d*(?:Cr|cr)?(?:[ \t]*[+])?)', re.MULTILINE | re.ASCII)
+_2025_LINE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})\|[ \t]*\d{2}:\d{2}[ \t]+(.+?)[ \t]+((?:\+[ \t]*)?C[ \t]*[\d,]+\.?\d*)', re.ASCII)
+_ROW_AMOUNT_RE = re.compile(r'((?:C\s*)?[\d,]+\.?\d*(?:Cr|cr)?(?:\s*[+])?)')
+# HDFC specific headers: Date, Transaction Description, Amount
+_HDFC_TABLE_MARKERS = (
+    'date transaction description amount',
+    'transaction description',
+    'amount (in rs',
+    'date & time transaction description amount pi',
+    'amount pi'
+)
+# One alternation pass over the joined header text replaces five separate
+# substring scans
+_HDFC_MARKER_RE = re.compile('|'.join(map(re.escape, _HDFC_TABLE_MARKERS)))
+# Header tokens that land in the page text whenever a transaction table is
+# present - sniffed on the head of the text before paying for extract_tables
+_TABLE_SNIFF_TOKENS = ('transaction description', 'date & time', 'amount (in rs')
+# 2025 single-column rows carry a "DD/MM/YYYY|" date and a "C " amount marker
+_YEAR_MARKERS = ('2025|', '2024|', '2023|', '2026|')
+_CREDIT_MARKER = 'c '
+_NAME_PATTERNS = (
+    re.compile(r'^[A-Z\s]+$'),  # All caps letters and spaces
+    re.compile(r'^V CHRISTOPHER RAJA$'),
+    re.compile(r'^[A-Z][A-Z\s]+[A-Z]$')  # Starts and ends with capital letters
+)
+_REF_RE = re.compile(r'Ref#\s*(\d+)|\b(\d{8,})\b')
+
 class HDFCParser(BaseParser):
     def __init__(self):
-        super().__init__("HDFC")
+        super().__init__(_BANK)
     
     def parse_pdf(self, pdf: pdfplumber.PDF) -> List[Transaction]:
-        transactions = []
-        
         try:
-            for page_num, page in enumerate(pdf.pages):
-                # Parse tables first
-                tables = page.extract_tables()
-                for table in tables:
-                    if self._is_transaction_table(table):
-                        page_transactions = self._parse_transaction_table(table)
-                        transactions.extend(page_transactions)
-                
-                # If no tables found, try text parsing
-                if not tables or not any(self._is_transaction_table(table) for table in tables):
-                    text_transactions = self._parse_text_format(page)
-                    transactions.extend(text_transactions)
-                    
+            transactions = self.parse_pages_in_parallel(pdf)
+
             logger.info(f"HDFC parser extracted {len(transactions)} transactions")
-            return [t for t in transactions if self.validate_transaction(t)]
-            
+            # Each _parse_* helper already validates before appending, so no
+            # second validation pass is needed here
+            return transactions
+
         except Exception as e:
             logger.error(f"HDFC parser failed: {str(e)}")
             return []
+
+    def _parse_page(self, page) -> List[Transaction]:
+        transactions = []
+
+        # Pull the text first (cheap relative to table extraction) and skip
+        # obvious non-transaction pages before any layout analysis
+        text = self.extract_page_text(page) or ""
+        if not self.has_date_hint(text):
+            return transactions
+
+        # Table headers leave their tokens in the page text, so sniffing the
+        # head of the text tells us whether the expensive extract_tables
+        # layout analysis can find anything at all
+        found_transaction_table = False
+        head = text[:2000].lower()
+        if any(token in head for token in _TABLE_SNIFF_TOKENS):
+            # Parse tables first, remembering whether any matched so we
+            # don't have to re-check every table for the fallback below
+            tables = self.extract_page_tables(page)
+            for table in tables:
+                if self._is_transaction_table(table):
+                    found_transaction_table = True
+                    page_transactions = self._parse_transaction_table(table)
+                    transactions.extend(page_transactions)
+
+        # If no transaction tables found, try text parsing
+        if not found_transaction_table:
+            text_transactions = self._parse_text_format(text)
+            transactions.extend(text_transactions)
+
+        return transactions
     
     def _is_transaction_table(self, table: List[List[str]]) -> bool:
         """Check if table contains HDFC transaction data"""
@@ -42,34 +98,27 @@ class HDFCParser(BaseParser):
         
         # Look for HDFC-specific headers
         headers_text = ' '.join([cell.lower() if cell else "" for cell in table[0]])
-        
-        # HDFC specific headers: Date, Transaction Description, Amount
-        hdfc_indicators = [
-            'date transaction description amount',
-            'transaction description',
-            'amount (in rs',
-            'date & time transaction description amount pi',
-            'amount pi'
-        ]
-        
+
         # Check for transaction data patterns in the table content
-        if any(indicator in headers_text for indicator in hdfc_indicators):
+        if _HDFC_MARKER_RE.search(headers_text):
             return True
-        
-        # For 2025 format, check if table contains transaction-like data
+
+        # For 2025 format, check if table contains transaction-like data -
+        # pure substring checks, no regex involved
         for row in table[1:3]:  # Check first few data rows
             if len(row) > 0 and row[0]:
                 row_text = row[0].lower()
                 # Look for date patterns and transaction indicators
-                if ('2025|' in row_text or '2024|' in row_text) and ('c ' in row_text):
+                if _CREDIT_MARKER in row_text and any(year in row_text for year in _YEAR_MARKERS):
                     return True
-        
+
         return False
     
     def _parse_transaction_table(self, table: List[List[str]]) -> List[Transaction]:
         """Parse HDFC transaction table - handles both 2024 and 2025 formats"""
         transactions = []
-        
+        fallback_id = 0
+
         try:
             # Skip header row and process data rows
             for row in table[1:]:
@@ -118,13 +167,19 @@ class HDFCParser(BaseParser):
                     if amount == 0:
                         continue
                     
-                    # Generate transaction ID from reference numbers in description
-                    txn_id = self._extract_reference_number(description) or f"HDFC_{date_str}_{len(transactions)}"
+                    # Generate transaction ID from reference numbers in description;
+                    # the fallback formats a plain local counter - cheaper than
+                    # embedding the date, which never disambiguated anything the
+                    # duplicate hash doesn't already cover
+                    txn_id = self._extract_reference_number(description)
+                    if not txn_id:
+                        txn_id = f"HDFC_{fallback_id}"
+                        fallback_id += 1
                     
                     # Create transaction
                     transaction = Transaction(
                         date=self.normalize_date(self._clean_date(date_str), "DD/MM/YYYY"),
-                        bank="HDFC",
+                        bank=_BANK,
                         txn_id=txn_id,
                         description=self.clean_description(description),
                         amount=amount
@@ -138,43 +193,43 @@ class HDFCParser(BaseParser):
             
         return transactions
     
-    def _parse_text_format(self, page) -> List[Transaction]:
+    def _parse_text_format(self, text: str) -> List[Transaction]:
         """Parse transactions from text when table extraction fails"""
         transactions = []
-        
+        fallback_id = 0
+
         try:
-            text = page.extract_text()
             if not text:
                 return transactions
-            
-            lines = text.split('\n')
-            
-            for line in lines:
-                # Look for transaction pattern: DD/MM/YYYY Description Amount
-                # Handle both 2024 format (DD/MM/YYYY) and 2025 format (DD/MM/YYYY| HH:MM)
-                match = re.match(r'^(\d{1,2}/\d{1,2}/\d{4})(?:\|\s*\d{2}:\d{2})?\s+(.+?)\s+((?:C\s*)?[\d,]+\.?\d*(?:Cr|cr)?(?:\s*[+])?)', line.strip())
-                
-                if match:
-                    date_str = match.group(1)
-                    description = match.group(2)
-                    amount_str = match.group(3)
-                    
-                    amount = self._parse_amount(amount_str)
-                    if amount == 0:
-                        continue
-                    
-                    txn_id = self._extract_reference_number(description) or f"HDFC_TEXT_{date_str}_{len(transactions)}"
-                    
-                    transaction = Transaction(
-                        date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                        bank="HDFC",
-                        txn_id=txn_id,
-                        description=self.clean_description(description),
-                        amount=amount
-                    )
-                    
-                    if self.validate_transaction(transaction):
-                        transactions.append(transaction)
+
+            # Look for transaction pattern: DD/MM/YYYY Description Amount
+            # Handle both 2024 format (DD/MM/YYYY) and 2025 format
+            # (DD/MM/YYYY| HH:MM) - one finditer pass over the whole page
+            # text replaces the per-line split/match loop
+            for match in _HDFC_LINE_RE.finditer(text):
+                date_str = match.group(1)
+                description = match.group(2)
+                amount_str = match.group(3)
+
+                amount = self._parse_amount(amount_str)
+                if amount == 0:
+                    continue
+
+                txn_id = self._extract_reference_number(description)
+                if not txn_id:
+                    txn_id = f"HDFC_TEXT_{fallback_id}"
+                    fallback_id += 1
+
+                transaction = Transaction(
+                    date=self.normalize_date(date_str, "DD/MM/YYYY"),
+                    bank=_BANK,
+                    txn_id=txn_id,
+                    description=self.clean_description(description),
+                    amount=amount
+                )
+
+                if self.validate_transaction(transaction):
+                    transactions.append(transaction)
             
         except Exception as e:
             logger.error(f"Failed to parse HDFC text format: {str(e)}")
@@ -185,8 +240,23 @@ class HDFCParser(BaseParser):
         """Check if string matches DD/MM/YYYY format (with optional time)"""
         if not date_str:
             return False
-        # Handle both DD/MM/YYYY and DD/MM/YYYY| HH:MM formats
-        return bool(re.match(r'^\d{1,2}/\d{1,2}/\d{4}(?:\|\s*\d{2}:\d{2})?', date_str.strip()))
+        # Hand-rolled scan of the DD/MM/YYYY prefix - this runs on every
+        # table row, and a character check is much cheaper than the regex
+        # engine. Trailing text (e.g. "| HH:MM") is allowed, matching the
+        # old unanchored-suffix behaviour.
+        s = date_str.strip()
+        n = len(s)
+        i = 0
+        while i < n and i < 2 and s[i].isdigit():
+            i += 1
+        if i == 0 or i >= n or s[i] != '/':
+            return False
+        j = i + 1
+        while j < n and j < i + 3 and s[j].isdigit():
+            j += 1
+        if j == i + 1 or j >= n or s[j] != '/':
+            return False
+        return n >= j + 5 and s[j + 1:j + 5].isdigit()
     
     def _clean_date(self, date_str: str) -> str:
         """Remove time component from date string"""
@@ -200,14 +270,8 @@ class HDFCParser(BaseParser):
             return False
         
         text = row[0].strip().upper()
-        # Common patterns for name rows
-        name_patterns = [
-            r'^[A-Z\s]+$',  # All caps letters and spaces
-            r'^V CHRISTOPHER RAJA$',
-            r'^[A-Z][A-Z\s]+[A-Z]$'  # Starts and ends with capital letters
-        ]
-        
-        return any(re.match(pattern, text) for pattern in name_patterns) and len(text.split()) <= 4
+        # Check the cheap word count first so most rows never hit a regex
+        return len(text.split()) <= 4 and any(pattern.match(text) for pattern in _NAME_PATTERNS)
     
     def _parse_amount_from_row(self, amount_str: str, description: str) -> float:
         """Parse amount from amount column or description"""
@@ -218,7 +282,7 @@ class HDFCParser(BaseParser):
                 return amount
         
         # Try to find amount in description for single-column formats
-        amount_match = re.search(r'((?:C\s*)?[\d,]+\.?\d*(?:Cr|cr)?(?:\s*[+])?)', description)
+        amount_match = _ROW_AMOUNT_RE.search(description)
         if amount_match:
             return self._parse_amount(amount_match.group(1))
         
@@ -230,39 +294,45 @@ class HDFCParser(BaseParser):
             return 0.0
         
         try:
-            # Clean the amount string
             amount_clean = amount_str.strip()
-            
+
             # Handle different credit indicators
             is_credit = False
-            
+
             # 2024 format: uses "Cr" suffix
             if amount_clean.lower().endswith('cr'):
                 is_credit = True
-                amount_clean = amount_clean[:-2].strip()
-            
-            # 2025 format: uses "+ " prefix for credits
-            if amount_clean.startswith('+'):
-                is_credit = True
-                amount_clean = amount_clean[1:].strip()
-            
-            # Remove "C " prefix used in 2025 format
-            if amount_clean.startswith('C '):
-                amount_clean = amount_clean[2:].strip()
-            elif amount_clean.startswith('C'):
-                amount_clean = amount_clean[1:].strip()
-            
-            # Remove commas and currency symbols
-            amount_clean = re.sub(r'[,₹Rs\.](?=\d{3})', '', amount_clean)
-            amount_clean = re.sub(r'[,₹Rs]', '', amount_clean)
-            
-            # Handle decimal
-            if '.' in amount_clean:
-                # Keep only the last decimal point
+                amount_clean = amount_clean[:-2]
+
+            # Single pass over the remainder: keep digits and decimal
+            # points, flag the 2025 "+" credit marker, and drop the known
+            # decorations (the 2025 "C " column marker, commas, currency
+            # symbols). Anything outside that alphabet means the cell is
+            # not an amount (times, dates, stray labels) - bail instead
+            # of fabricating a number from whatever digits it contains
+            digits = []
+            for ch in amount_clean:
+                if ch.isdigit() or ch == '.':
+                    digits.append(ch)
+                elif ch == '+':
+                    # 2025 format: uses "+" for credits
+                    is_credit = True
+                elif ch not in ',Cr₹Rs' and not ch.isspace():
+                    return 0.0
+
+            if not digits or digits[0] == '.':
+                # A leading dot comes from text like "Rs. 500", never
+                # from a real amount
+                return 0.0
+
+            amount_clean = ''.join(digits)
+
+            # Keep only the last decimal point (earlier ones are
+            # thousands separators)
+            if amount_clean.count('.') > 1:
                 parts = amount_clean.split('.')
-                if len(parts) > 2:
-                    amount_clean = '.'.join(parts[:-1]) + '.' + parts[-1]
-            
+                amount_clean = ''.join(parts[:-1]) + '.' + parts[-1]
+
             amount = float(amount_clean)
             
             # Apply expense tracking sign convention:
@@ -279,22 +349,17 @@ class HDFCParser(BaseParser):
     
     def _extract_reference_number(self, description: str) -> str:
         """Extract reference number from description"""
-        # Look for Ref# pattern
-        ref_match = re.search(r'Ref#\s*([0-9]+)', description)
-        if ref_match:
-            return ref_match.group(1)
-        
-        # Look for other number patterns
-        num_match = re.search(r'\b(\d{8,})\b', description)
-        if num_match:
-            return num_match.group(1)
-        
+        # One scan covers both the Ref# pattern and bare long numbers
+        match = _REF_RE.search(description)
+        if match:
+            return match.group(1) or match.group(2)
         return ""
     
     def _parse_2025_single_column(self, cell_content: str) -> List[Transaction]:
         """Parse 2025 single-column format where all data is in one cell"""
         transactions = []
-        
+        fallback_id = 0
+
         try:
             # Split by newlines to get individual transaction lines
             lines = cell_content.split('\n')
@@ -302,13 +367,19 @@ class HDFCParser(BaseParser):
             for line in lines:
                 if not line.strip():
                     continue
-                
+
+                # Cheap guards: a 2025 transaction line always carries the
+                # date pipe and the C amount marker, so most lines skip the
+                # regex (and the name check) entirely
+                if '|' not in line or 'C' not in line:
+                    continue
+
                 # Skip name lines
                 if self._is_name_line(line):
                     continue
-                
+
                 # Look for transaction pattern in 2025 format: DD/MM/YYYY| HH:MM Description Amount
-                match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})\|\s*\d{2}:\d{2}\s+(.+?)\s+((?:\+\s*)?C\s*[\d,]+\.?\d*)', line)
+                match = _2025_LINE_RE.search(line)
                 
                 if match:
                     date_str = match.group(1)
@@ -321,12 +392,15 @@ class HDFCParser(BaseParser):
                         continue
                     
                     # Extract transaction ID
-                    txn_id = self._extract_reference_number(description) or f"HDFC_2025_{date_str}_{len(transactions)}"
+                    txn_id = self._extract_reference_number(description)
+                    if not txn_id:
+                        txn_id = f"HDFC_2025_{fallback_id}"
+                        fallback_id += 1
                     
                     # Create transaction
                     transaction = Transaction(
                         date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                        bank="HDFC",
+                        bank=_BANK,
                         txn_id=txn_id,
                         description=self.clean_description(description),
                         amount=amount
@@ -343,4 +417,10 @@ class HDFCParser(BaseParser):
     def _is_name_line(self, line: str) -> bool:
         """Check if line contains just customer name"""
         line = line.strip().upper()
-        return line == "V CHRISTOPHER RAJA" or (len(line.split()) <= 4 and line.isalpha())
\ No newline at end of file
+        if line == "V CHRISTOPHER RAJA":
+            return True
+        # Pure string-method checks; str.isalpha was previously defeated by
+        # the spaces in multi-word names
+        return (len(line) <= 40 and
+                len(line.split()) <= 4 and
+                line.replace(' ', '').isalpha())
\ No newline at end of file
@@ -1,59 +1,105 @@
 import logging
 import re
+import sys
 from typing import List
+import pandas as pd
 import pdfplumber
 from .base_parser import BaseParser
 from models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Single interned bank-name object shared by every Transaction
+_BANK = sys.intern("ICICI")
+
+# Translation table strips separators/currency marks in one C-level pass;
+# includes the mojibake form of the rupee sign seen in some extractions
+_AMOUNT_STRIP = str.maketrans('', '', ',`₹â‚¹')
+
+# ICICI specific headers: Date, SerNo., Transaction Details, Reward Points, Amount
+_ICICI_INDICATORS = (
+    'transaction details',
+    'reward points',
+    'serno',
+    'intl. # amount',  # Matches "Intl.#\namount" after whitespace normalization
+    'amount (in',
+)
+# One alternation pass over the joined header text replaces five separate
+# substring scans
+_ICICI_INDICATOR_RE = re.compile('|'.join(map(re.escape, _ICICI_INDICATORS)))
+
+# Header tokens that land in the page text whenever a transaction table is
+# present - sniffed on the head of the text before paying for extract_tables
+_TABLE_SNIFF_TOKENS = ('transaction details', 'reward points', 'serno')
+
+# Maps newline variants to spaces in one C-level pass instead of chained
+# str.replace calls per header cell
+_WS_TABLE = str.maketrans('\n\r\t', '   ')
+
+# Below this row count the pandas call overhead outweighs the vectorized
+# amount parsing win, so small tables stay on the per-row path
+_VECTORIZE_MIN_ROWS = 20
+
 class ICICIParser(BaseParser):
     def __init__(self):
-        super().__init__("ICICI")
+        super().__init__(_BANK)
     
     def parse_pdf(self, pdf: pdfplumber.PDF) -> List[Transaction]:
-        transactions = []
-        
         try:
-            for page_num, page in enumerate(pdf.pages):
-                # Note: Don't skip first page entirely as some ICICI statements
-                # have transactions on the first page (e.g. December 2024 format)
-                
-                # Parse tables first
-                tables = page.extract_tables()
-
-                # Handle case where headers and data might be in separate tables
-                combined_tables = self._combine_adjacent_transaction_tables(tables)
-
-                for table in combined_tables:
-                    if self._is_transaction_table(table):
-                        page_transactions = self._parse_transaction_table(table)
-                        transactions.extend(page_transactions)
-                
-                # Always try text parsing as fallback for ICICI statements
-                # Some ICICI statements have transactions in both table and text formats
-                text_transactions = self._parse_text_format(page)
-
-                # Combine transactions, only removing truly identical duplicates
-                combined_transactions = transactions + text_transactions
-                unique_transactions = []
-                seen_transactions = set()
-
-                for txn in combined_transactions:
-                    # Only deduplicate if transactions are completely identical
-                    txn_key = f"{txn.date}|{txn.amount}|{txn.description.strip()}"
-                    if txn_key not in seen_transactions:
-                        unique_transactions.append(txn)
-                        seen_transactions.add(txn_key)
-
-                transactions = unique_transactions
-                    
+            page_transactions = self.parse_pages_in_parallel(pdf)
+
+            # Deduplicate in the main process after gathering page results -
+            # workers only see their own page, so cross-page duplicates can
+            # only be caught here. The seen-set keeps dedup linear in the
+            # total transaction count.
+            transactions = []
+            seen_transactions = set()
+            for txn in page_transactions:
+                # Only deduplicate if transactions are completely identical
+                txn_key = (txn.date, txn.amount, txn.description.strip())
+                if txn_key not in seen_transactions:
+                    seen_transactions.add(txn_key)
+                    transactions.append(txn)
+
             logger.info(f"ICICI parser extracted {len(transactions)} transactions")
-            return [t for t in transactions if self.validate_transaction(t)]
-            
+            # Each _parse_* helper already validates before appending, so no
+            # second validation pass is needed here
+            return transactions
+
         except Exception as e:
             logger.error(f"ICICI parser failed: {str(e)}")
             return []
+
+    def _parse_page(self, page) -> List[Transaction]:
+        # Note: Don't skip first page entirely as some ICICI statements
+        # have transactions on the first page (e.g. December 2024 format)
+        transactions = []
+
+        # Extract text once per page - it feeds both the table sniff
+        # and the text-format fallback below
+        text = self.extract_page_text(page) or ""
+
+        # Table headers leave their tokens in the page text, so
+        # sniffing the head of the text tells us whether the expensive
+        # extract_tables layout analysis can find anything at all
+        head = text[:2000].lower()
+        if any(token in head for token in _TABLE_SNIFF_TOKENS):
+            tables = self.extract_page_tables(page)
+
+            # Handle case where headers and data might be in separate tables;
+            # the combine step already classified every table, so reuse its
+            # flags instead of re-joining the header row per table
+            combined_tables, table_flags = self._combine_adjacent_transaction_tables(tables)
+
+            for table, is_txn_table in zip(combined_tables, table_flags):
+                if is_txn_table:
+                    transactions.extend(self._parse_transaction_table(table))
+
+        # Always try text parsing as fallback for ICICI statements
+        # Some ICICI statements have transactions in both table and text formats
+        transactions.extend(self._parse_text_format(text))
+
+        return transactions
     
     def _is_transaction_table(self, table: List[List[str]]) -> bool:
         """Check if table contains ICICI transaction data"""
@@ -62,40 +108,41 @@ class ICICIParser(BaseParser):
 
         # Look for ICICI-specific headers
         # Handle multi-line headers by normalizing whitespace and newlines
-        headers_text = ' '.join([cell.lower().replace('\n', ' ').replace('\r', ' ') if cell else "" for cell in table[0]])
+        headers_text = ' '.join([cell.lower().translate(_WS_TABLE) if cell else "" for cell in table[0]])
 
-        # ICICI specific headers: Date, SerNo., Transaction Details, Reward Points, Amount
-        icici_indicators = [
-            'transaction details',
-            'reward points',
-            'serno',
-            'intl. # amount',  # Updated to match "Intl.#\namount"
-            'amount (in'
-        ]
+        return bool(_ICICI_INDICATOR_RE.search(headers_text))
 
-        return any(indicator in headers_text for indicator in icici_indicators)
+    def _combine_adjacent_transaction_tables(self, tables: List[List[List[str]]]):
+        """Combine adjacent tables that might be split transaction tables.
 
-    def _combine_adjacent_transaction_tables(self, tables: List[List[List[str]]]) -> List[List[List[str]]]:
-        """Combine adjacent tables that might be split transaction tables"""
+        Returns the combined tables together with their transaction-table
+        flags so callers don't re-run the header classification.
+        """
         if not tables:
-            return tables
+            return tables, []
+
+        # Classify every table once up front; combining a header table with
+        # its data rows keeps the header row, so the flag carries over
+        is_txn_table = [self._is_transaction_table(table) for table in tables]
 
         combined_tables = []
+        combined_flags = []
         i = 0
 
         while i < len(tables):
             current_table = tables[i]
 
             # Check if current table has transaction headers but minimal data
-            if (self._is_transaction_table(current_table) and len(current_table) <= 2):
+            if (is_txn_table[i] and len(current_table) <= 2):
 
                 # Look for transaction data in subsequent tables (skip empty tables)
                 data_table_found = False
                 for j in range(i + 1, len(tables)):
                     candidate_table = tables[j]
 
-                    # Skip empty or minimal tables
-                    if not candidate_table or all(not row or all(not cell or not cell.strip() for cell in row) for row in candidate_table):
+                    # Skip empty or minimal tables - any() bails out at the
+                    # first non-blank cell instead of walking every row
+                    if not any(cell and cell.strip() for row in candidate_table for cell in (row or ())):
                         continue
 
                     # Check if this table has transaction-like data
@@ -103,6 +150,7 @@ class ICICIParser(BaseParser):
                         # Combine tables: headers from current + data from candidate
                         combined_table = current_table + candidate_table
                         combined_tables.append(combined_table)
+                        combined_flags.append(True)
                         data_table_found = True
                         # Skip all tables up to and including the data table
                         i = j + 1
@@ -113,101 +161,129 @@ class ICICIParser(BaseParser):
 
                 if not data_table_found:
                     combined_tables.append(current_table)
+                    combined_flags.append(True)
                     i += 1
             else:
                 combined_tables.append(current_table)
+                combined_flags.append(is_txn_table[i])
                 i += 1
 
-        return combined_tables
+        return combined_tables, combined_flags
 
     def _looks_like_transaction_data(self, table: List[List[str]]) -> bool:
         """Check if table rows look like transaction data (date, serial, amount patterns)"""
         if not table:
             return False
 
-        for row in table:
-            if row and len(row) >= 3:
-                # Check first column for date pattern
-                first_col = row[0] if row[0] else ""
-                if self._is_valid_date(first_col):
-                    return True
-
-        return False
+        # Check the first column of each row for a date pattern, stopping
+        # at the first hit
+        return any(
+            row and len(row) >= 3 and self._is_valid_date(row[0] or "")
+            for row in table
+        )
 
     def _parse_transaction_table(self, table: List[List[str]]) -> List[Transaction]:
         """Parse ICICI transaction table with format: Date | SerNo. | Transaction Details | Reward Points | Intl.# | Amount"""
         transactions = []
         
         try:
-            # Skip header row and process data rows
+            # Pass 1: collect raw fields from data rows after the header row
+            parsed_rows = []
             for row in table[1:]:
                 if len(row) < 4:  # Need at least date, details, and amount
                     continue
-                
+
                 # Extract data from row
                 date_str = row[0] if len(row) > 0 else ""
                 ser_no = row[1] if len(row) > 1 else ""
                 description = row[2] if len(row) > 2 else ""
                 amount_str = row[-1] if len(row) > 0 else ""  # Amount is typically last column
-                
+
                 # Validate date format (DD/MM/YYYY)
                 if not self._is_valid_date(date_str):
                     continue
-                
+
                 # Skip if no description or amount
                 if not description or not amount_str:
                     continue
-                
-                # Parse amount
-                amount = self._parse_amount(amount_str)
+
+                parsed_rows.append((date_str, ser_no, description, amount_str))
+
+            # Normalize amounts in one vectorized pandas call for big
+            # tables; per-row parsing only pays off below the threshold
+            amounts = self._parse_amounts(parsed_rows)
+
+            # Pass 2: build the transactions
+            for (date_str, ser_no, description, amount_str), amount in zip(parsed_rows, amounts):
                 if amount == 0:
                     continue
-                
+
                 # Create transaction
                 transaction = Transaction(
                     date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                    bank="ICICI",
+                    bank=_BANK,
                     txn_id=ser_no or f"ICICI_{date_str}_{len(transactions)}",
                     description=self.clean_description(description),
                     amount=amount
                 )
-                
+
                 if self.validate_transaction(transaction):
                     transactions.append(transaction)
-            
+
         except Exception as e:
             logger.error(f"Failed to parse ICICI transaction table: {str(e)}")
-            
+
         return transactions
+
+    def _parse_amounts(self, parsed_rows: List[tuple]) -> List[float]:
+        """Parse the amount column of collected rows, vectorizing via
+        pandas when the table is large enough to amortize the call"""
+        amount_strs = [row[3] for row in parsed_rows]
+
+        if len(amount_strs) < _VECTORIZE_MIN_ROWS:
+            return [self._parse_amount(amount_str) for amount_str in amount_strs]
+
+        series = pd.Series(amount_strs).str.strip()
+        is_credit = series.str.upper().str.endswith('CR')
+        cleaned = series.mask(is_credit, series.str[:-2].str.strip()).str.translate(_AMOUNT_STRIP)
+
+        # Unparseable cells coerce to NaN and become 0.0, matching
+        # _parse_amount's failure behaviour so those rows get dropped
+        values = pd.to_numeric(cleaned, errors='coerce').fillna(0.0).abs()
+        return list(values.where(~is_credit, -values))
     
-    def _parse_text_format(self, page) -> List[Transaction]:
+    def _parse_text_format(self, text: str) -> List[Transaction]:
         """Parse transactions from text when table extraction fails"""
         transactions = []
-        
+
         try:
-            text = page.extract_text()
             if not text:
                 return transactions
-            
+
             lines = text.split('\n')
             
             for line in lines:
+                line = line.strip()
+
+                # Cheap shape guard: a transaction line starts with a digit
+                # and has a slash within the first three characters, so
+                # headers/footers/blank lines never reach the regex engine
+                if len(line) < 10 or not line[0].isdigit() or '/' not in line[1:3]:
+                    continue
+
                 # Look for transaction pattern: DD/MM/YYYY SERNUM Description Amount
-                match = re.match(r'^(\d{1,2}/\d{1,2}/\d{4})\s+(\d+)\s+(.+?)\s+([\d,]+\.?\d*(?:\s*CR)?)$', line.strip())
-                
-                if match:
-                    date_str = match.group(1)
-                    ser_no = match.group(2)
-                    description = match.group(3)
-                    amount_str = match.group(4)
-                    
+                parsed = self._parse_icici_line(line)
+
+                if parsed:
+                    date_str, ser_no, description, amount_str = parsed
+
                     amount = self._parse_amount(amount_str)
                     if amount == 0:
                         continue
                     
                     transaction = Transaction(
                         date=self.normalize_date(date_str, "DD/MM/YYYY"),
-                        bank="ICICI",
+                        bank=_BANK,
                         txn_id=ser_no,
                         description=self.clean_description(description),
                         amount=amount
@@ -221,11 +297,73 @@ class ICICIParser(BaseParser):
             
         return transactions
     
+    def _parse_icici_line(self, line: str):
+        """Split a statement line into (date, serno, description, amount).
+
+        The line format is fixed (DD/MM/YYYY SERNUM Description Amount[ CR]),
+        so whitespace splits and character checks replace the regex engine
+        entirely on this hot path. Returns None for non-transaction lines.
+        """
+        parts = line.split(None, 2)
+        if len(parts) < 3:
+            return None
+
+        date_str, ser_no, rest = parts
+        if not self._is_valid_date(date_str) or not ser_no.isdigit():
+            return None
+
+        # Peel the amount off the end; a trailing CR marker belongs to it
+        pieces = rest.rsplit(None, 1)
+        if len(pieces) < 2:
+            return None
+        description, amount_str = pieces
+        if amount_str == 'CR':
+            pieces = description.rsplit(None, 1)
+            if len(pieces) < 2:
+                return None
+            description, amount_str = pieces
+            amount_str += ' CR'
+            amount_body = amount_str[:-3]
+        else:
+            amount_body = amount_str
+
+        # Amount shape: digits and commas, at most one dot, not dot-first,
+        # no commas after the dot
+        if not amount_body or amount_body[0] == '.':
+            return None
+        dot_seen = False
+        for ch in amount_body:
+            if ch == '.':
+                if dot_seen:
+                    return None
+                dot_seen = True
+            elif ch == ',':
+                if dot_seen:
+                    return None
+            elif not ch.isdigit():
+                return None
+
+        return date_str, ser_no, description, amount_str
+
     def _is_valid_date(self, date_str: str) -> bool:
         """Check if string matches DD/MM/YYYY format"""
         if not date_str:
             return False
-        return bool(re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', date_str.strip()))
+        # Hand-rolled check of the DD/MM/YYYY shape - this runs on every
+        # table row, and character tests beat the regex engine on short
+        # strings by a wide margin
+        s = date_str.strip()
+        first_slash = s.find('/')
+        second_slash = s.rfind('/')
+        return (
+            1 <= first_slash <= 2
+            and second_slash != first_slash
+            and second_slash - first_slash <= 3
+            and len(s) - second_slash == 5
+            and s[:first_slash].isdigit()
+            and s[first_slash + 1:second_slash].isdigit()
+            and s[second_slash + 1:].isdigit()
+        )
     
     def _parse_amount(self, amount_str: str) -> float:
         """Parse amount from ICICI format (numbers with optional CR for credit)"""
@@ -236,13 +374,13 @@ class ICICIParser(BaseParser):
             # Clean the amount string
             amount_clean = amount_str.strip()
             
-            # Check if it's a credit (CR suffix)
-            is_credit = amount_clean.upper().endswith('CR')
+            # Check if it's a credit (CR suffix) - only uppercase the tail
+            is_credit = amount_clean[-2:].upper() == 'CR'
             if is_credit:
                 amount_clean = amount_clean[:-2].strip()  # Remove CR suffix
-            
-            # Remove commas and convert to float
-            amount_clean = re.sub(r'[,`₹]', '', amount_clean)
+
+            # Remove commas and currency marks, then convert to float
+            amount_clean = amount_clean.translate(_AMOUNT_STRIP)
             amount = float(amount_clean)
             
             # Apply expense tracking sign convention:
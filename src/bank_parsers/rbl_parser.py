@@ -1,5 +1,6 @@
 import logging
 import re
+import sys
 from typing import List
 import pdfplumber
 from .base_parser import BaseParser
@@ -7,32 +8,116 @@ from models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Single interned bank-name object shared by every Transaction
+_BANK = sys.intern("RBL")
+
+# Pre-compiled patterns - compiling once at import avoids the per-call
+# cache lookup in the re module on every statement line
+# ASCII skips Unicode class lookups - dates, amounts and references in
+# these statements are plain ASCII
+_RBL_LINE_RE = re.compile(r'^(\d{1,2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)$', re.ASCII)
+# MULTILINE variant so one finditer over the whole page text replaces the
+# Python split/strip/match loop; [ \t] keeps matches within a single line
+_RBL_LINE_RE_M = re.compile(
+    r'^[ \t]*(\d{1,2}[ \t]+\w{3}[ \t]+\d{4})[ \t]+(.+?)[ \t]+([\d,]+\.?\d*)[ \t]*$',
+    re.MULTILINE | re.ASCII)
+_RBL_DATE_HINT_RE = re.compile(r'\d{1,2}\s+\w{3}\s+\d{4}', re.ASCII)
+# Known multi-token sequences decode to real text; any other (cid:NN)
+# token is dropped. One alternation pass handles both - the named
+# sequences are listed first so they win over the bare-token branch.
+_CID_REPLACEMENTS = {
+    '(cid:68)(cid:114)(cid:69)(cid:65)(cid:77)': 'DREAM',
+    # Add more as needed based on observed patterns
+}
+_CID_RE = re.compile(
+    '|'.join(map(re.escape, _CID_REPLACEMENTS)) + r'|\(cid:\d+\)'
+)
+
+def _decode_cid(match):
+    return _CID_REPLACEMENTS.get(match.group(0), '')
+_AMOUNT_CLEAN_RE = re.compile(r'[,₹Rs]')
+_REF_RE = re.compile(r'\b(\d{6,})\b', re.ASCII)
+
+# Multi-pattern scans: one alternation pass over the lowered line replaces
+# a chain of substring searches per pattern
+_HEADER_PATTERNS = (
+    'date description amount',
+    'account summary',
+    'card number',
+    'total amount due',
+    'min. amt. due',
+    'payment due date',
+    'available reward points',
+    'statement period',
+    'statement date',
+)
+_HEADER_RE = re.compile('|'.join(map(re.escape, _HEADER_PATTERNS)))
+_SUMMARY_PATTERNS = (
+    'total amount due',
+    'min. amt. due',
+    'payment due date',
+    'card number',
+    'available reward',
+    'points to expire',
+    'opening balance',
+    'closing balance',
+    'fuel surcharge',
+    'bonus points',
+    'membership fee',
+    't&cs apply',
+    'use code',
+    'valid till',
+    'rblfares',
+    'opt for',
+    'download',
+    'pay utility',
+)
+_SUMMARY_RE = re.compile('|'.join(map(re.escape, _SUMMARY_PATTERNS)))
+_CREDIT_PATTERNS = (
+    'payment',
+    'upi',
+    'transfer',
+    'credit',
+    'refund',
+    'reversal',
+    'cashback',
+    'reward',
+    'adjustment',
+)
+_CREDIT_RE = re.compile('|'.join(map(re.escape, _CREDIT_PATTERNS)))
+
 class RBLParser(BaseParser):
     def __init__(self):
-        super().__init__("RBL")
+        super().__init__(_BANK)
     
     def parse_pdf(self, pdf: pdfplumber.PDF) -> List[Transaction]:
-        transactions = []
-        
         try:
-            for page_num, page in enumerate(pdf.pages):
-                # Parse tables first
-                tables = page.extract_tables()
-                for table in tables:
-                    if self._is_transaction_table(table):
-                        page_transactions = self._parse_transaction_table(table)
-                        transactions.extend(page_transactions)
-                
-                # Parse text format (primary method for RBL)
-                text_transactions = self._parse_text_format(page)
-                transactions.extend(text_transactions)
-                    
+            transactions = self.parse_pages_in_parallel(pdf)
+
             logger.info(f"RBL parser extracted {len(transactions)} transactions")
-            return [t for t in transactions if self.validate_transaction(t)]
-            
+            # _parse_transaction_line already validates before returning, so
+            # no second validation pass is needed here
+            return transactions
+
         except Exception as e:
             logger.error(f"RBL parser failed: {str(e)}")
             return []
+
+    def _parse_page(self, page) -> List[Transaction]:
+        transactions = []
+
+        # Parse tables first
+        tables = self.extract_page_tables(page)
+        for table in tables:
+            if self._is_transaction_table(table):
+                page_transactions = self._parse_transaction_table(table)
+                transactions.extend(page_transactions)
+
+        # Parse text format (primary method for RBL)
+        text_transactions = self._parse_text_format(page)
+        transactions.extend(text_transactions)
+
+        return transactions
     
     def _is_transaction_table(self, table: List[List[str]]) -> bool:
         """Check if table contains RBL transaction data"""
@@ -57,8 +142,9 @@ class RBLParser(BaseParser):
         for row in table[1:3]:  # Check first few data rows
             if len(row) > 0 and row[0]:
                 row_text = row[0].lower()
-                # Look for date patterns and transaction indicators
-                if self._contains_date_pattern(row_text) and any(char.isdigit() for char in row_text):
+                # Look for date patterns - a match guarantees digits, so no
+                # separate per-character digit scan is needed
+                if self._contains_date_pattern(row_text):
                     return True
         
         return False
@@ -78,7 +164,7 @@ class RBLParser(BaseParser):
                     line = row[0].strip()
                     
                     # Skip non-transaction lines
-                    if not line or self._is_summary_line(line):
+                    if not line or self._is_summary_line(line.lower()):
                         continue
                     
                     # Parse transaction from single line
@@ -96,23 +182,24 @@ class RBLParser(BaseParser):
         transactions = []
         
         try:
-            text = page.extract_text()
+            text = self.extract_page_text(page)
             if not text:
                 return transactions
-            
-            lines = text.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Skip headers and summary lines
-                if self._is_header_line(line) or self._is_summary_line(line):
+
+            # Decode once over the whole buffer, then let one MULTILINE
+            # finditer drive line matching in C rather than splitting and
+            # re-anchoring the regex per line
+            text = self._decode_rbl_text(text)
+
+            for match in _RBL_LINE_RE_M.finditer(text):
+                # Skip headers and summary lines - lower once, both checks
+                # share the same string
+                line_lower = match.group(0).lower()
+                if self._is_header_line(line_lower) or self._is_summary_line(line_lower):
                     continue
-                
-                # Parse transaction from line
-                transaction = self._parse_transaction_line(line)
+
+                transaction = self._build_transaction(
+                    match.group(1), match.group(2), match.group(3))
                 if transaction:
                     transactions.append(transaction)
             
@@ -129,36 +216,46 @@ class RBLParser(BaseParser):
             
             # RBL format: DD MMM YYYY Description Amount
             # Example: "13 Jul 2025 MS OMR MALL DEVELOPER KANCHIPURAM IND 160.00"
-            match = re.match(r'^(\d{1,2}\s+\w{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)$', line.strip())
-            
+            match = _RBL_LINE_RE.match(line.strip())
+
             if match:
-                date_str = match.group(1).strip()
-                description = match.group(2).strip()
-                amount_str = match.group(3).strip()
-                
-                # Parse amount
-                amount = self._parse_amount(amount_str, description)
-                if amount == 0:
-                    return None
-                
-                # Generate transaction ID
-                txn_id = self._generate_transaction_id(date_str, description)
-                
-                # Create transaction
-                transaction = Transaction(
-                    date=self.normalize_date(date_str, "DD MMM YYYY"),
-                    bank="RBL",
-                    txn_id=txn_id,
-                    description=self.clean_description(description),
-                    amount=amount
-                )
-                
-                if self.validate_transaction(transaction):
-                    return transaction
-            
+                return self._build_transaction(
+                    match.group(1), match.group(2), match.group(3))
+
         except Exception as e:
             logger.debug(f"Could not parse RBL transaction line '{line}': {e}")
-            
+
+        return None
+
+    def _build_transaction(self, date_str: str, description: str, amount_str: str) -> Transaction:
+        """Build a validated Transaction from already-matched line fields"""
+        try:
+            date_str = date_str.strip()
+            description = description.strip()
+
+            # Parse amount
+            amount = self._parse_amount(amount_str.strip(), description)
+            if amount == 0:
+                return None
+
+            # Generate transaction ID
+            txn_id = self._generate_transaction_id(date_str, description)
+
+            # Create transaction
+            transaction = Transaction(
+                date=self.normalize_date(date_str, "DD MMM YYYY"),
+                bank=_BANK,
+                txn_id=txn_id,
+                description=self.clean_description(description),
+                amount=amount
+            )
+
+            if self.validate_transaction(transaction):
+                return transaction
+
+        except Exception as e:
+            logger.debug(f"Could not build RBL transaction from '{date_str}' '{description}' '{amount_str}': {e}")
+
         return None
     
     def _decode_rbl_text(self, text: str) -> str:
@@ -168,19 +265,10 @@ class RBLParser(BaseParser):
         
         # Handle common encoded patterns from RBL 2024 format
         # This is a simplified decoder - in practice, you might need more comprehensive handling
-        
-        # Remove encoded character patterns like (cid:XX)
-        text = re.sub(r'\(cid:\d+\)', '', text)
-        
-        # Common character replacements
-        replacements = {
-            '(cid:68)(cid:114)(cid:69)(cid:65)(cid:77)': 'DREAM',
-            # Add more as needed based on observed patterns
-        }
-        
-        for encoded, decoded in replacements.items():
-            text = text.replace(encoded, decoded)
-        
+
+        # Decode known sequences and strip stray (cid:XX) tokens in one pass
+        text = _CID_RE.sub(_decode_cid, text)
+
         return text.strip()
     
     def _contains_date_pattern(self, text: str) -> bool:
@@ -189,50 +277,15 @@ class RBLParser(BaseParser):
             return False
         
         # RBL uses DD MMM YYYY format
-        return bool(re.search(r'\d{1,2}\s+\w{3}\s+\d{4}', text))
-    
-    def _is_header_line(self, line: str) -> bool:
-        """Check if line is a header"""
-        line_lower = line.lower()
-        header_patterns = [
-            'date description amount',
-            'account summary',
-            'card number',
-            'total amount due',
-            'min. amt. due',
-            'payment due date',
-            'available reward points',
-            'statement period',
-            'statement date'
-        ]
-        
-        return any(pattern in line_lower for pattern in header_patterns)
+        return bool(_RBL_DATE_HINT_RE.search(text))
     
-    def _is_summary_line(self, line: str) -> bool:
-        """Check if line is a summary/non-transaction line"""
-        line_lower = line.lower()
-        summary_patterns = [
-            'total amount due',
-            'min. amt. due',
-            'payment due date',
-            'card number',
-            'available reward',
-            'points to expire',
-            'opening balance',
-            'closing balance',
-            'fuel surcharge',
-            'bonus points',
-            'membership fee',
-            't&cs apply',
-            'use code',
-            'valid till',
-            'rblfares',
-            'opt for',
-            'download',
-            'pay utility'
-        ]
-        
-        return any(pattern in line_lower for pattern in summary_patterns)
+    def _is_header_line(self, line_lower: str) -> bool:
+        """Check if an already-lowered line is a header"""
+        return bool(_HEADER_RE.search(line_lower))
+
+    def _is_summary_line(self, line_lower: str) -> bool:
+        """Check if an already-lowered line is a summary/non-transaction line"""
+        return bool(_SUMMARY_RE.search(line_lower))
     
     def _parse_amount(self, amount_str: str, description: str) -> float:
         """Parse amount from RBL format"""
@@ -244,20 +297,22 @@ class RBLParser(BaseParser):
             amount_clean = amount_str.strip()
             
             # Remove commas and currency symbols
-            amount_clean = re.sub(r'[,₹Rs]', '', amount_clean)
+            amount_clean = _AMOUNT_CLEAN_RE.sub('', amount_clean)
             
             amount = float(amount_clean)
             
             # Determine if this is a credit or debit based on description
             is_credit = self._is_credit_transaction(description)
-            
+
             # Apply expense tracking sign convention:
             # - Credits (payments, refunds) = negative (reduces expense)
             # - Debits (purchases) = positive (increases expense)
+            # The amount comes from a digits-only regex group, so it is
+            # already non-negative and abs() would be a no-op
             if is_credit:
-                return -abs(amount)  # Credits are negative
+                return -amount  # Credits are negative
             else:
-                return abs(amount)   # Debits are positive
+                return amount   # Debits are positive
             
         except (ValueError, AttributeError) as e:
             logger.debug(f"Could not parse amount '{amount_str}': {e}")
@@ -265,29 +320,16 @@ class RBLParser(BaseParser):
     
     def _is_credit_transaction(self, description: str) -> bool:
         """Determine if transaction is a credit based on description"""
-        description_lower = description.lower()
-        
-        # Credit indicators
-        credit_patterns = [
-            'payment',
-            'upi',
-            'transfer',
-            'credit',
-            'refund',
-            'reversal',
-            'cashback',
-            'reward',
-            'adjustment'
-        ]
-        
-        return any(pattern in description_lower for pattern in credit_patterns)
+        return bool(_CREDIT_RE.search(description.lower()))
     
     def _generate_transaction_id(self, date_str: str, description: str) -> str:
         """Generate transaction ID for RBL transactions"""
-        # Look for any reference numbers in description
-        ref_match = re.search(r'\b(\d{6,})\b', description)
-        if ref_match:
-            return ref_match.group(1)
+        # Look for any reference numbers in description - skip the regex
+        # entirely when the description holds no digits at all
+        if any(c.isdigit() for c in description):
+            ref_match = _REF_RE.search(description)
+            if ref_match:
+                return ref_match.group(1)
         
         # Use first few words of description as identifier
         words = description.split()[:3]
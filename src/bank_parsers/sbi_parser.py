@@ -1,39 +1,106 @@
 import logging
 import re
+import sys
 from typing import List
+import pandas as pd
 import pdfplumber
 from .base_parser import BaseParser
 from models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Single interned bank-name object shared by every Transaction
+_BANK = sys.intern("SBI")
+
+# Pre-compiled patterns - compiling once at import avoids the per-call
+# cache lookup in the re module on every statement line
+# ASCII skips Unicode class lookups - dates, amounts and references in
+# these statements are plain ASCII
+# MULTILINE so one finditer over the whole page text replaces a Python
+# split/strip/match loop; [ \t] keeps matches from crossing line breaks
+_SBI_LINE_RE = re.compile(
+    r'^[ \t]*(\d{1,2}[ \t]+\w{3}[ \t]+\d{2})[ \t]+(.+?)[ \t]+([\d,]+\.?\d*)[ \t]+([CD])[ \t]*$',
+    re.MULTILINE | re.ASCII)
+_SBI_DATE_HINT_RE = re.compile(r'\d{1,2}\s+\w{3}\s+\d{2}', re.ASCII)
+_SBI_AMOUNT_CD_RE = re.compile(r'[\d,]+\.?\d*\s+[CD]', re.ASCII)
+_AMOUNT_CLEAN_RE = re.compile(r'[,₹Rs`]')
+# Same character set as _AMOUNT_CLEAN_RE, for pandas' C-level translate
+_AMOUNT_STRIP_TABLE = str.maketrans('', '', ',₹Rs`')
+# Below this entry count the pandas call overhead outweighs the vectorized
+# amount parsing win, so small tables stay on the per-entry path
+_VECTORIZE_MIN_ROWS = 20
+# Month abbreviations for the hand-rolled DD MMM YY check below
+_MONTHS = frozenset({'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'})
+_PAYMENT_REF_RE = re.compile(r'000DP\d+[A-Za-z0-9]+', re.ASCII)
+_REF_RE = re.compile(r'\b([A-Z0-9]{6,})\b', re.ASCII)
+_ID_CLEAN_RE = re.compile(r'[^A-Z0-9_]')
+# Multi-pattern scan: one alternation pass over the lowered description
+# replaces a chain of substring searches per pattern
+_HEADER_DESC_PATTERNS = (
+    'transactions for',
+    'transaction details',
+    'statement',
+    'account summary',
+    'previous balance',
+    'available credit',
+    'payment due date',
+    'shop & smile',
+    'important information',
+)
+_HEADER_DESC_RE = re.compile('|'.join(map(re.escape, _HEADER_DESC_PATTERNS)))
+# Header phrases that mark a table as the SBI transaction table
+_TABLE_HEADER_PATTERNS = (
+    'date transaction details amount',
+    'transaction details',
+    'amount ( `',
+    'amount (rs',
+)
+_TABLE_HEADER_RE = re.compile('|'.join(map(re.escape, _TABLE_HEADER_PATTERNS)))
+
 class SBIParser(BaseParser):
     def __init__(self):
-        super().__init__("SBI")
+        super().__init__(_BANK)
     
     def parse_pdf(self, pdf: pdfplumber.PDF) -> List[Transaction]:
-        transactions = []
-        
         try:
-            for page_num, page in enumerate(pdf.pages):
-                # Parse tables first (primary method for SBI)
-                tables = page.extract_tables()
-                for table in tables:
-                    if self._is_transaction_table(table):
-                        page_transactions = self._parse_transaction_table(table)
-                        transactions.extend(page_transactions)
-                
-                # Parse text format as fallback
-                if not any(self._is_transaction_table(table) for table in tables):
-                    text_transactions = self._parse_text_format(page)
-                    transactions.extend(text_transactions)
-                    
+            transactions = self.parse_pages_in_parallel(pdf)
+
             logger.info(f"SBI parser extracted {len(transactions)} transactions")
-            return [t for t in transactions if self.validate_transaction(t)]
-            
+            # _create_sbi_transaction already validates before returning, so
+            # no second validation pass is needed here
+            return transactions
+
         except Exception as e:
             logger.error(f"SBI parser failed: {str(e)}")
             return []
+
+    def _parse_page(self, page) -> List[Transaction]:
+        transactions = []
+
+        # Pull the text first (cheap via PyMuPDF) and skip table inference
+        # entirely on pages with nothing SBI-date-like - cover, summary and
+        # terms pages never contain a DD MMM YY token
+        text = self.extract_page_text(page) or ""
+        if not _SBI_DATE_HINT_RE.search(text):
+            return transactions
+
+        # Parse tables first (primary method for SBI), remembering whether
+        # any matched so the fallback below doesn't re-classify every table
+        tables = self.extract_page_tables(page)
+        found_transaction_table = False
+        for table in tables:
+            if self._is_transaction_table(table):
+                found_transaction_table = True
+                page_transactions = self._parse_transaction_table(table)
+                transactions.extend(page_transactions)
+
+        # Parse text format as fallback
+        if not found_transaction_table:
+            text_transactions = self._parse_text_format(page)
+            transactions.extend(text_transactions)
+
+        return transactions
     
     def _is_transaction_table(self, table: List[List[str]]) -> bool:
         """Check if table contains SBI transaction data"""
@@ -44,18 +111,11 @@ class SBIParser(BaseParser):
         if len(table[0]) != 3:  # SBI uses 3-column format
             return False
         
-        # Check for SBI headers
-        headers = [cell.lower() if cell else "" for cell in table[0]]
-        header_text = ' '.join(headers)
-        
-        sbi_indicators = [
-            'date transaction details amount',
-            'transaction details',
-            'amount ( `',
-            'amount (rs',
-        ]
-        
-        if any(indicator in header_text for indicator in sbi_indicators):
+        # Check for SBI headers - one alternation pass over the joined
+        # header instead of a substring scan per indicator
+        header_text = ' '.join(cell.lower() if cell else "" for cell in table[0])
+
+        if _TABLE_HEADER_RE.search(header_text):
             return True
         
         # Check if data row contains SBI-style multi-line format
@@ -76,92 +136,128 @@ class SBIParser(BaseParser):
         transactions = []
         
         try:
-            # Skip header row and process data rows
+            # Pass 1: flatten every row's multi-line cells into one list of
+            # (date, description, amount) entries - a table often packs many
+            # transactions into a single physical row
+            entries = []
             for row in table[1:]:
                 if not row or len(row) != 3:  # SBI requires exactly 3 columns
                     continue
-                
+
                 dates_cell = row[0] if row[0] else ""
                 descriptions_cell = row[1] if row[1] else ""
                 amounts_cell = row[2] if row[2] else ""
-                
-                # Split multi-line cells
-                dates = [d.strip() for d in dates_cell.split('\n') if d.strip()]
-                descriptions = [d.strip() for d in descriptions_cell.split('\n') if d.strip()]
-                amounts = [a.strip() for a in amounts_cell.split('\n') if a.strip()]
-                
+
+                # Split multi-line cells - splitlines takes the C path, and
+                # splitting the date cell first lets header/blank rows bail
+                # out before the other two cells are touched
+                dates = [d for d in map(str.strip, dates_cell.splitlines()) if d]
+                if not dates:
+                    continue
+
+                descriptions = [d for d in map(str.strip, descriptions_cell.splitlines()) if d]
+                amounts = [a for a in map(str.strip, amounts_cell.splitlines()) if a]
+
                 # Skip if we don't have corresponding entries
-                if not dates or not descriptions or not amounts:
+                if not descriptions or not amounts:
                     continue
-                
+
                 # Process transactions - use minimum length to avoid mismatched data
                 min_length = min(len(dates), len(descriptions), len(amounts))
-                
+
                 for i in range(min_length):
                     date_str = dates[i]
                     description = descriptions[i]
                     amount_str = amounts[i]
-                    
+
                     # Skip invalid entries
                     if not self._is_valid_sbi_date(date_str) or not description or not amount_str:
                         continue
-                    
+
                     # Skip header-like descriptions
                     if self._is_header_description(description):
                         continue
-                    
-                    # Parse transaction
-                    transaction = self._create_sbi_transaction(date_str, description, amount_str)
-                    if transaction:
-                        transactions.append(transaction)
-            
+
+                    entries.append((date_str, description, amount_str))
+
+            # Normalize the whole amount column in one vectorized call for
+            # big tables; per-entry parsing only pays off below the threshold
+            amounts = self._parse_sbi_amounts(entries)
+
+            # Pass 2: build the transactions
+            for (date_str, description, amount_str), amount in zip(entries, amounts):
+                transaction = self._create_sbi_transaction(date_str, description, amount_str, amount)
+                if transaction:
+                    transactions.append(transaction)
+
         except Exception as e:
             logger.error(f"Failed to parse SBI transaction table: {str(e)}")
-            
+
         return transactions
+
+    def _parse_sbi_amounts(self, entries: List[tuple]) -> List[float]:
+        """Parse the amount column of collected entries, vectorizing the
+        common suffix-marker form via pandas on big tables"""
+        amount_strs = [entry[2] for entry in entries]
+
+        if len(amount_strs) < _VECTORIZE_MIN_ROWS:
+            return [self._parse_sbi_amount(amount_str) for amount_str in amount_strs]
+
+        series = pd.Series(amount_strs).str.strip()
+        tail = series.str[-2:]
+        is_credit = tail == ' C'
+        has_suffix = is_credit | (tail == ' D')
+
+        cleaned = series.str[:-2].str.strip().str.translate(_AMOUNT_STRIP_TABLE)
+        values = pd.to_numeric(cleaned.where(has_suffix), errors='coerce').fillna(0.0).abs()
+        values = values.where(~is_credit, -values)
+
+        # Entries without the trailing marker are rare; they fall back to
+        # the per-entry path which handles in-string C/D indicators
+        amounts = list(values)
+        for i, suffixed in enumerate(has_suffix):
+            if not suffixed:
+                amounts[i] = self._parse_sbi_amount(amount_strs[i])
+        return amounts
     
     def _parse_text_format(self, page) -> List[Transaction]:
         """Parse transactions from text when table extraction fails"""
         transactions = []
         
         try:
-            text = page.extract_text()
+            text = self.extract_page_text(page)
             if not text:
                 return transactions
             
-            lines = text.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Look for transaction pattern: DD MMM YY Description Amount C/D
-                # Example: "28 Nov 24 FUEL SURCHARGE WAIVER EXCL TAX 5.04 C"
-                match = re.match(r'^(\d{1,2}\s+\w{3}\s+\d{2})\s+(.+?)\s+([\d,]+\.?\d*)\s+([CD])$', line)
-                
-                if match:
-                    date_str = match.group(1).strip()
-                    description = match.group(2).strip()
-                    amount_num = match.group(3).strip()
-                    cd_indicator = match.group(4).strip()
-                    
-                    amount_str = f"{amount_num} {cd_indicator}"
-                    
-                    transaction = self._create_sbi_transaction(date_str, description, amount_str)
-                    if transaction:
-                        transactions.append(transaction)
+            # Look for transaction pattern: DD MMM YY Description Amount C/D
+            # Example: "28 Nov 24 FUEL SURCHARGE WAIVER EXCL TAX 5.04 C"
+            # One MULTILINE finditer walks the buffer in C rather than
+            # splitting and re-anchoring the regex per line
+            for match in _SBI_LINE_RE.finditer(text):
+                date_str = match.group(1)
+                description = match.group(2)
+                amount_str = f"{match.group(3)} {match.group(4)}"
+
+                transaction = self._create_sbi_transaction(date_str, description, amount_str)
+                if transaction:
+                    transactions.append(transaction)
             
         except Exception as e:
             logger.error(f"Failed to parse SBI text format: {str(e)}")
             
         return transactions
     
-    def _create_sbi_transaction(self, date_str: str, description: str, amount_str: str) -> Transaction:
-        """Create SBI transaction from parsed data"""
+    def _create_sbi_transaction(self, date_str: str, description: str, amount_str: str,
+                                amount: float = None) -> Transaction:
+        """Create SBI transaction from parsed data.
+
+        Pass a precomputed amount to skip the per-entry parse when the
+        caller already normalized the column in bulk.
+        """
         try:
             # Parse amount
-            amount = self._parse_sbi_amount(amount_str)
+            if amount is None:
+                amount = self._parse_sbi_amount(amount_str)
             if amount == 0:
                 return None
             
@@ -171,7 +267,7 @@ class SBIParser(BaseParser):
             # Create transaction
             transaction = Transaction(
                 date=self.normalize_date(date_str, "DD MMM YY"),
-                bank="SBI",
+                bank=_BANK,
                 txn_id=txn_id,
                 description=self.clean_description(description),
                 amount=amount
@@ -191,7 +287,7 @@ class SBIParser(BaseParser):
             return False
         
         # Look for SBI date pattern
-        return bool(re.search(r'\d{1,2}\s+\w{3}\s+\d{2}', text))
+        return bool(_SBI_DATE_HINT_RE.search(text))
     
     def _contains_sbi_amount_pattern(self, text: str) -> bool:
         """Check if text contains SBI amount pattern with C/D indicators"""
@@ -199,33 +295,28 @@ class SBIParser(BaseParser):
             return False
         
         # Look for amounts with C or D suffix
-        return bool(re.search(r'[\d,]+\.?\d*\s+[CD]', text))
+        return bool(_SBI_AMOUNT_CD_RE.search(text))
     
     def _is_valid_sbi_date(self, date_str: str) -> bool:
         """Check if string matches SBI date format (DD MMM YY)"""
         if not date_str:
             return False
         
-        # SBI uses DD MMM YY format
-        return bool(re.match(r'^\d{1,2}\s+\w{3}\s+\d{2}$', date_str.strip()))
+        # SBI uses DD MMM YY format - split plus character tests run on
+        # every table cell and beat the regex engine on short strings.
+        # Also tighter than the old \w{3} pattern: the month token must be
+        # a real month abbreviation and the day must be in range.
+        parts = date_str.split()
+        return (
+            len(parts) == 3
+            and len(parts[0]) <= 2 and parts[0].isdigit() and 1 <= int(parts[0]) <= 31
+            and parts[1].capitalize() in _MONTHS
+            and len(parts[2]) == 2 and parts[2].isdigit()
+        )
     
     def _is_header_description(self, description: str) -> bool:
         """Check if description is a header line"""
-        description_lower = description.lower()
-        
-        header_patterns = [
-            'transactions for',
-            'transaction details',
-            'statement',
-            'account summary',
-            'previous balance',
-            'available credit',
-            'payment due date',
-            'shop & smile',
-            'important information'
-        ]
-        
-        return any(pattern in description_lower for pattern in header_patterns)
+        return bool(_HEADER_DESC_RE.search(description.lower()))
     
     def _parse_sbi_amount(self, amount_str: str) -> float:
         """Parse amount from SBI format with C/D indicators"""
@@ -236,14 +327,15 @@ class SBIParser(BaseParser):
             # Clean and extract amount and indicator
             amount_str = amount_str.strip()
             
-            # Extract C/D indicator
+            # Extract C/D indicator - one tail slice covers the common
+            # suffix case instead of two endswith scans
             is_credit = False
-            
-            if amount_str.endswith(' C'):
+            tail = amount_str[-2:]
+
+            if tail == ' C':
                 is_credit = True
                 amount_clean = amount_str[:-2].strip()
-            elif amount_str.endswith(' D'):
-                is_credit = False
+            elif tail == ' D':
                 amount_clean = amount_str[:-2].strip()
             else:
                 # Try to find C or D in the string
@@ -251,13 +343,12 @@ class SBIParser(BaseParser):
                     is_credit = True
                     amount_clean = amount_str.replace(' C', '').strip()
                 elif ' D' in amount_str:
-                    is_credit = False
                     amount_clean = amount_str.replace(' D', '').strip()
                 else:
                     amount_clean = amount_str
             
             # Remove commas and currency symbols
-            amount_clean = re.sub(r'[,₹Rs`]', '', amount_clean)
+            amount_clean = _AMOUNT_CLEAN_RE.sub('', amount_clean)
             
             amount = float(amount_clean)
             
@@ -275,21 +366,24 @@ class SBIParser(BaseParser):
     
     def _generate_sbi_transaction_id(self, date_str: str, description: str) -> str:
         """Generate transaction ID for SBI transactions"""
-        # Look for payment reference numbers
-        payment_match = re.search(r'000DP\d+[A-Za-z0-9]+', description)
-        if payment_match:
-            return payment_match.group(0)
-        
+        # Look for payment reference numbers - the regex can only match if
+        # the literal prefix is present, and the substring check is far
+        # cheaper than entering the regex engine
+        if '000DP' in description:
+            payment_match = _PAYMENT_REF_RE.search(description)
+            if payment_match:
+                return payment_match.group(0)
+
         # Look for other reference numbers
-        ref_match = re.search(r'\b([A-Z0-9]{6,})\b', description)
+        ref_match = _REF_RE.search(description)
         if ref_match:
             return ref_match.group(1)
-        
+
         # Use first few words of description as identifier
         words = description.split()[:3]
         identifier = '_'.join(words).upper()
-        
+
         # Remove special characters
-        identifier = re.sub(r'[^A-Z0-9_]', '', identifier)
+        identifier = _ID_CLEAN_RE.sub('', identifier)
         
         return f"SBI_{date_str.replace(' ', '_')}_{identifier}"[:50]  # Limit length
\ No newline at end of file
@@ -1,20 +1,43 @@
+import atexit
+import multiprocessing
 import os
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class Config:
-    GOOGLE_APPLICATION_CREDENTIALS: str = os.getenv('GOOGLE_APPLICATION_CREDENTIALS', '')
-    GOOGLE_DRIVE_FOLDER_ID: str = os.getenv('GOOGLE_DRIVE_FOLDER_ID', '')
-    GOOGLE_SHEET_ID: str = os.getenv('GOOGLE_SHEET_ID', '')
-    
-    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
-    POLL_INTERVAL_MINUTES: int = int(os.getenv('POLL_INTERVAL_MINUTES', '15'))
-    
-    MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
-    BATCH_SIZE: int = int(os.getenv('BATCH_SIZE', '100'))
+    # Environment-backed settings: (name, default, cast), loaded in one
+    # pass by _load_env below
+    _ENV_SPEC = (
+        ('GOOGLE_APPLICATION_CREDENTIALS', '', str),
+        ('GOOGLE_DRIVE_FOLDER_ID', '', str),
+        ('GOOGLE_SHEET_ID', '', str),
+        ('LOG_LEVEL', 'INFO', str),
+        ('POLL_INTERVAL_MINUTES', '15', int),
+        ('MAX_RETRIES', '3', int),
+        ('BATCH_SIZE', '100', int),
+        ('PDF_WORKERS', '4', int),
+    )
+
+    GOOGLE_APPLICATION_CREDENTIALS: str
+    GOOGLE_DRIVE_FOLDER_ID: str
+    GOOGLE_SHEET_ID: str
+
+    LOG_LEVEL: str
+    POLL_INTERVAL_MINUTES: int
+
+    MAX_RETRIES: int
+    BATCH_SIZE: int
+    PDF_WORKERS: int
+
+    @classmethod
+    def _load_env(cls) -> None:
+        for name, default, cast in cls._ENV_SPEC:
+            setattr(cls, name, cast(os.environ.get(name, default)))
+        cls._config_valid = None
     
     SUPPORTED_BANKS = ['axis', 'hdfc', 'sbi', 'icici', 'rbl']
     PROCESSED_FOLDER_NAME = 'processed'
@@ -29,8 +52,17 @@ class Config:
         'https://www.googleapis.com/auth/spreadsheets'
     ]
     
+    # Cached validate_config result; _load_env resets it
+    _config_valid: Optional[bool] = None
+
     @classmethod
     def validate_config(cls) -> bool:
+        if cls._config_valid is None:
+            cls._config_valid = cls._validate_config()
+        return cls._config_valid
+
+    @classmethod
+    def _validate_config(cls) -> bool:
         required_vars = [
             'GOOGLE_APPLICATION_CREDENTIALS',
             'GOOGLE_DRIVE_FOLDER_ID', 
@@ -49,21 +81,35 @@ class Config:
             
         return True
     
+    _log_listener: Optional[QueueListener] = None
+
     @classmethod
     def setup_logging(cls) -> None:
         log_level = getattr(logging, cls.LOG_LEVEL.upper(), logging.INFO)
-        
+
         # Create logs directory if it doesn't exist
         os.makedirs('logs', exist_ok=True)
-        
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(os.path.join('logs', 'app.log'))
-            ]
-        )
-        
+
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler()
+        file_handler = logging.FileHandler(os.path.join('logs', 'app.log'))
+        stream_handler.setFormatter(formatter)
+        file_handler.setFormatter(formatter)
+
+        # Records go through a queue drained by a listener thread, so log
+        # calls on the parsing path never block on file writes. The queue
+        # is a multiprocessing one so forked parser workers feed the same
+        # listener instead of writing (or losing) their own records.
+        log_queue = multiprocessing.Queue(-1)
+        cls._log_listener = QueueListener(log_queue, stream_handler, file_handler)
+        cls._log_listener.start()
+        atexit.register(cls._log_listener.stop)
+
+        root = logging.getLogger()
+        root.setLevel(log_level)
+        root.handlers = [QueueHandler(log_queue)]
+
         logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.ERROR)
-        logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
\ No newline at end of file
+        logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
+
+Config._load_env()
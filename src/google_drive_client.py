@@ -1,8 +1,9 @@
 import io
 import csv
 import logging
+import threading
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 from google.auth.transport.requests import Request
@@ -12,11 +13,45 @@ from models import ProcessedFile
 
 logger = logging.getLogger(__name__)
 
+# Statements are a few MB at most, so a 10 MB chunk pulls each file in a
+# single HTTPS round trip instead of one per library-default chunk
+_DOWNLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+# Drive's batch endpoint accepts at most 100 sub-requests per call
+_BATCH_MOVE_LIMIT = 100
+
 class GoogleDriveClient:
     def __init__(self):
         self.credentials = self._get_credentials()
-        self.service = build('drive', 'v3', credentials=self.credentials)
-        
+        self.service = self._build_service()
+        # googleapiclient's underlying httplib2 transport is not
+        # thread-safe, so concurrent downloads build one service per
+        # worker thread; the main thread reuses the service above
+        self._thread_local = threading.local()
+        self._thread_local.service = self.service
+        # Resolved folder IDs are stable for the life of the client, so
+        # cache them after the first lookup instead of re-issuing a
+        # files().list round trip per file
+        self._processed_folder_id = None
+        self._failed_folder_id = None
+        # Filename indexes for the two folders, fetched with one listing
+        # each so per-file existence checks become local set lookups
+        self._processed_names = None
+        self._failed_names = None
+        # errors.csv is buffered in memory and flushed once per batch so
+        # each failed file no longer re-downloads and re-uploads the
+        # whole (ever-growing) log
+        self._error_csv_buffer = None
+        self._error_csv_file_id = None
+        self._error_csv_dirty = False
+
+    def invalidate_folder_cache(self) -> None:
+        """Forget cached folder IDs and name indexes so the next call
+        re-resolves them"""
+        self._processed_folder_id = None
+        self._failed_folder_id = None
+        self._processed_names = None
+        self._failed_names = None
+
     def _get_credentials(self) -> Credentials:
         try:
             credentials = Credentials.from_service_account_file(
@@ -56,12 +91,28 @@ class GoogleDriveClient:
             logger.error(f"Failed to list Google Drive files: {str(e)}")
             raise
     
+    def _build_service(self):
+        """Build a Drive service from the bundled discovery document.
+
+        static_discovery skips the discovery-doc HTTP fetch that would
+        otherwise run per service build - it matters now that worker
+        threads each build their own service.
+        """
+        return build('drive', 'v3', credentials=self.credentials,
+                     cache_discovery=False, static_discovery=True)
+
+    def _get_thread_service(self):
+        """Return a Drive service bound to the calling thread"""
+        if not hasattr(self._thread_local, 'service'):
+            self._thread_local.service = self._build_service()
+        return self._thread_local.service
+
     def download_file(self, file_id: str) -> io.BytesIO:
         try:
-            request = self.service.files().get_media(fileId=file_id)
+            request = self._get_thread_service().files().get_media(fileId=file_id)
             file_buffer = io.BytesIO()
-            
-            downloader = MediaIoBaseDownload(file_buffer, request)
+
+            downloader = MediaIoBaseDownload(file_buffer, request, chunksize=_DOWNLOAD_CHUNK_SIZE)
             done = False
             
             while done is False:
@@ -86,6 +137,10 @@ class GoogleDriveClient:
                 fields='id, parents'
             ).execute()
             
+            # Keep the cached name index in sync with the move
+            if self._processed_names is not None:
+                self._processed_names.add(filename)
+
             logger.info(f"Moved {filename} to processed folder")
             return True
             
@@ -93,7 +148,60 @@ class GoogleDriveClient:
             logger.error(f"Failed to move file {filename}: {str(e)}")
             return False
     
+    def batch_move_to_processed(self, entries: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """Move several files to the processed folder with batched requests.
+
+        entries holds (file_id, filename) pairs; returns filename ->
+        success. Batching folds up to 100 moves into one HTTP round trip
+        instead of one per file.
+        """
+        results = {}
+        if not entries:
+            return results
+
+        try:
+            processed_folder_id = self._get_or_create_processed_folder()
+        except Exception as e:
+            logger.error(f"Failed to resolve processed folder for batch move: {str(e)}")
+            return {filename: False for _, filename in entries}
+
+        def handle_response(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to move file {request_id}: {str(exception)}")
+                results[request_id] = False
+            else:
+                # Keep the cached name index in sync with the move
+                if self._processed_names is not None:
+                    self._processed_names.add(request_id)
+                logger.info(f"Moved {request_id} to processed folder")
+                results[request_id] = True
+
+        for start in range(0, len(entries), _BATCH_MOVE_LIMIT):
+            chunk = entries[start:start + _BATCH_MOVE_LIMIT]
+            try:
+                batch = self.service.new_batch_http_request(callback=handle_response)
+                for file_id, filename in chunk:
+                    batch.add(
+                        self.service.files().update(
+                            fileId=file_id,
+                            addParents=processed_folder_id,
+                            removeParents=Config.GOOGLE_DRIVE_FOLDER_ID,
+                            fields='id, parents'
+                        ),
+                        request_id=filename
+                    )
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Batch move request failed: {str(e)}")
+                for _, filename in chunk:
+                    results.setdefault(filename, False)
+
+        return results
+
     def _get_or_create_processed_folder(self) -> str:
+        if self._processed_folder_id:
+            return self._processed_folder_id
+
         try:
             query = f"'{Config.GOOGLE_DRIVE_FOLDER_ID}' in parents and name='{Config.PROCESSED_FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
             
@@ -107,66 +215,77 @@ class GoogleDriveClient:
             
             if folders:
                 logger.debug(f"Found existing processed folder: {folders[0]['id']}")
-                return folders[0]['id']
-            
+                self._processed_folder_id = folders[0]['id']
+                return self._processed_folder_id
+
             folder_metadata = {
                 'name': Config.PROCESSED_FOLDER_NAME,
                 'mimeType': 'application/vnd.google-apps.folder',
                 'parents': [Config.GOOGLE_DRIVE_FOLDER_ID]
             }
-            
+
             folder = self.service.files().create(body=folder_metadata, fields='id').execute()
             logger.info(f"Created processed folder: {folder['id']}")
-            return folder['id']
+            self._processed_folder_id = folder['id']
+            return self._processed_folder_id
             
         except Exception as e:
             logger.error(f"Failed to get/create processed folder: {str(e)}")
             raise
     
-    def file_exists_in_processed(self, filename: str) -> bool:
-        try:
-            processed_folder_id = self._get_or_create_processed_folder()
-            
-            query = f"'{processed_folder_id}' in parents and name='{filename}' and trashed=false"
-            
+    def _load_folder_index(self, folder_id: str) -> set:
+        """List every file in a folder once and return the names as a set"""
+        names = set()
+        page_token = None
+
+        while True:
             results = self.service.files().list(
-                q=query,
-                pageSize=1,
-                fields="files(id)"
+                q=f"'{folder_id}' in parents and trashed=false",
+                pageSize=1000,
+                fields="nextPageToken, files(name)",
+                pageToken=page_token
             ).execute()
-            
-            files = results.get('files', [])
-            exists = len(files) > 0
-            
+
+            names.update(file['name'] for file in results.get('files', []))
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        return names
+
+    def file_exists_in_processed(self, filename: str) -> bool:
+        try:
+            # One listing builds the whole index; every later check is a
+            # local set lookup instead of a files().list round trip
+            if self._processed_names is None:
+                self._processed_names = self._load_folder_index(
+                    self._get_or_create_processed_folder())
+
+            exists = filename in self._processed_names
+
             if exists:
                 logger.debug(f"File {filename} already exists in processed folder")
-                
+
             return exists
-            
+
         except Exception as e:
             logger.error(f"Failed to check if file exists in processed folder: {str(e)}")
             return False
-    
+
     def file_exists_in_failed(self, filename: str) -> bool:
         try:
-            failed_folder_id = self._get_or_create_failed_folder()
-            
-            query = f"'{failed_folder_id}' in parents and name='{filename}' and trashed=false"
-            
-            results = self.service.files().list(
-                q=query,
-                pageSize=1,
-                fields="files(id)"
-            ).execute()
-            
-            files = results.get('files', [])
-            exists = len(files) > 0
-            
+            if self._failed_names is None:
+                self._failed_names = self._load_folder_index(
+                    self._get_or_create_failed_folder())
+
+            exists = filename in self._failed_names
+
             if exists:
                 logger.debug(f"File {filename} already exists in failed folder")
-                
+
             return exists
-            
+
         except Exception as e:
             logger.error(f"Failed to check if file exists in failed folder: {str(e)}")
             return False
@@ -185,7 +304,11 @@ class GoogleDriveClient:
             
             # Log error to CSV file in failed folder
             self._log_error_to_csv(failed_folder_id, filename, error_reason)
-            
+
+            # Keep the cached name index in sync with the move
+            if self._failed_names is not None:
+                self._failed_names.add(filename)
+
             logger.info(f"Moved {filename} to failed folder with reason: {error_reason}")
             return True
             
@@ -194,6 +317,9 @@ class GoogleDriveClient:
             return False
     
     def _get_or_create_failed_folder(self) -> str:
+        if self._failed_folder_id:
+            return self._failed_folder_id
+
         try:
             query = f"'{Config.GOOGLE_DRIVE_FOLDER_ID}' in parents and name='{Config.FAILED_FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
             
@@ -207,17 +333,19 @@ class GoogleDriveClient:
             
             if folders:
                 logger.debug(f"Found existing failed folder: {folders[0]['id']}")
-                return folders[0]['id']
-            
+                self._failed_folder_id = folders[0]['id']
+                return self._failed_folder_id
+
             folder_metadata = {
                 'name': Config.FAILED_FOLDER_NAME,
                 'mimeType': 'application/vnd.google-apps.folder',
                 'parents': [Config.GOOGLE_DRIVE_FOLDER_ID]
             }
-            
+
             folder = self.service.files().create(body=folder_metadata, fields='id').execute()
             logger.info(f"Created failed folder: {folder['id']}")
-            return folder['id']
+            self._failed_folder_id = folder['id']
+            return self._failed_folder_id
             
         except Exception as e:
             logger.error(f"Failed to get/create failed folder: {str(e)}")
@@ -225,23 +353,49 @@ class GoogleDriveClient:
     
     def _log_error_to_csv(self, failed_folder_id: str, filename: str, error_reason: str) -> None:
         try:
-            # Check if errors.csv already exists in failed folder
-            error_file_id = self._get_error_csv_file_id(failed_folder_id)
-            
-            if error_file_id:
-                # Download existing CSV, append new error, and upload back
-                existing_content = self._download_error_csv(error_file_id)
-                updated_content = self._append_error_to_csv(existing_content, filename, error_reason)
-                self._update_error_csv(error_file_id, updated_content)
-            else:
-                # Create new errors.csv file
-                csv_content = self._create_new_error_csv(filename, error_reason)
-                self._create_error_csv_file(failed_folder_id, csv_content)
-                
-            logger.debug(f"Logged error for {filename} to errors.csv")
-            
+            # First error of the run: pull the existing log (if any) into
+            # an in-memory buffer; later errors only append to the buffer
+            if self._error_csv_buffer is None:
+                self._error_csv_file_id = self._get_error_csv_file_id(failed_folder_id)
+
+                if self._error_csv_file_id:
+                    existing_content = self._download_error_csv(self._error_csv_file_id)
+                    self._error_csv_buffer = io.StringIO()
+                    self._error_csv_buffer.write(existing_content.rstrip() + "\n")
+                else:
+                    self._error_csv_buffer = io.StringIO()
+                    self._error_csv_buffer.write("Date,Filename,Reason\n")
+
+            # csv.writer handles quoting of embedded commas/quotes
+            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            csv.writer(self._error_csv_buffer).writerow([current_time, filename, error_reason])
+            self._error_csv_dirty = True
+
+            logger.debug(f"Buffered error for {filename} in errors.csv")
+
         except Exception as e:
             logger.error(f"Failed to log error to CSV: {str(e)}")
+
+    def flush_error_log(self) -> None:
+        """Upload buffered error rows to errors.csv, once per batch"""
+        if not self._error_csv_dirty:
+            return
+
+        try:
+            content = self._error_csv_buffer.getvalue()
+
+            if self._error_csv_file_id:
+                self._update_error_csv(self._error_csv_file_id, content)
+            else:
+                failed_folder_id = self._get_or_create_failed_folder()
+                self._error_csv_file_id = self._create_error_csv_file(failed_folder_id, content)
+
+            self._error_csv_dirty = False
+            logger.debug("Flushed buffered errors to errors.csv")
+
+        except Exception as e:
+            # Keep the buffer dirty so the next flush retries the upload
+            logger.error(f"Failed to flush error CSV: {str(e)}")
     
     def _get_error_csv_file_id(self, failed_folder_id: str) -> Optional[str]:
         try:
@@ -264,8 +418,8 @@ class GoogleDriveClient:
         try:
             request = self.service.files().get_media(fileId=file_id)
             file_buffer = io.BytesIO()
-            
-            downloader = MediaIoBaseDownload(file_buffer, request)
+
+            downloader = MediaIoBaseDownload(file_buffer, request, chunksize=_DOWNLOAD_CHUNK_SIZE)
             done = False
             
             while done is False:
@@ -278,17 +432,6 @@ class GoogleDriveClient:
             logger.error(f"Failed to download error CSV: {str(e)}")
             return ""
     
-    def _append_error_to_csv(self, existing_content: str, filename: str, error_reason: str) -> str:
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        new_row = f"\n{current_time},{filename},\"{error_reason}\""
-        return existing_content.rstrip() + new_row
-    
-    def _create_new_error_csv(self, filename: str, error_reason: str) -> str:
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        csv_content = "Date,Filename,Reason\n"
-        csv_content += f"{current_time},{filename},\"{error_reason}\""
-        return csv_content
-    
     def _update_error_csv(self, file_id: str, content: str) -> None:
         try:
             media = MediaIoBaseUpload(
@@ -305,7 +448,7 @@ class GoogleDriveClient:
             logger.error(f"Failed to update error CSV: {str(e)}")
             raise
     
-    def _create_error_csv_file(self, failed_folder_id: str, content: str) -> None:
+    def _create_error_csv_file(self, failed_folder_id: str, content: str) -> str:
         try:
             file_metadata = {
                 'name': Config.ERROR_LOG_FILENAME,
@@ -318,14 +461,15 @@ class GoogleDriveClient:
                 mimetype='text/csv'
             )
             
-            self.service.files().create(
+            created = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
             ).execute()
-            
+
             logger.debug(f"Created new error CSV file in failed folder")
-            
+            return created['id']
+
         except Exception as e:
             logger.error(f"Failed to create error CSV file: {str(e)}")
             raise
\ No newline at end of file
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
 from config import Config
@@ -28,7 +28,8 @@ class GoogleSheetsClient:
         try:
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=Config.GOOGLE_SHEET_ID,
-                range=f"{self.sheet_range}!A1:G1"
+                range=f"{self.sheet_range}!A1:G1",
+                fields='values'
             ).execute()
             
             values = result.get('values', [])
@@ -69,11 +70,15 @@ class GoogleSheetsClient:
             logger.error(f"Failed to write headers: {str(e)}")
             raise
     
-    def get_existing_transaction_hashes(self) -> Set[str]:
+    def get_existing_transaction_hashes(self) -> Set[Tuple[str, str, str, str, str]]:
         try:
+            # fields strips the range/majorDimension metadata from the
+            # response; rows were written with valueInputOption RAW, so
+            # they come back as the same plain strings they went in as
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=Config.GOOGLE_SHEET_ID,
-                range=f"{self.sheet_range}!A:E"
+                range=f"{self.sheet_range}!A:E",
+                fields='values'
             ).execute()
             
             values = result.get('values', [])
@@ -81,15 +86,14 @@ class GoogleSheetsClient:
             if len(values) <= 1:
                 return set()
             
-            hashes = set()
-            for row in values[1:]:
-                if len(row) >= 5:
-                    date, bank, txn_id, description, amount = row[0], row[1], row[2], row[3], row[4]
-                    hash_string = f"{date}|{bank}|{txn_id}|{description}|{amount}"
-                    import hashlib
-                    hash_value = hashlib.md5(hash_string.encode()).hexdigest()
-                    hashes.add(hash_value)
-                    
+            # Field tuples are the dedup keys - same shape as
+            # Transaction.get_duplicate_hash, no per-row digest work
+            hashes = {
+                (row[0], row[1], row[2], row[3], row[4])
+                for row in values[1:]
+                if len(row) >= 5
+            }
+
             logger.debug(f"Found {len(hashes)} existing transaction hashes")
             return hashes
             
@@ -97,29 +101,40 @@ class GoogleSheetsClient:
             logger.error(f"Failed to get existing transactions: {str(e)}")
             return set()
     
-    def batch_insert_transactions(self, transactions: List[Transaction]) -> bool:
+    def batch_insert_transactions(self, transactions: List[Transaction],
+                                  existing_hashes: Optional[Set[Tuple[str, str, str, str, str]]] = None) -> bool:
         try:
             if not transactions:
                 logger.info("No transactions to insert")
                 return True
-                
-            existing_hashes = self.get_existing_transaction_hashes()
-            
-            new_transactions = [
-                t for t in transactions 
-                if t.get_duplicate_hash() not in existing_hashes
-            ]
-            
+
+            # Callers processing several files per cycle pass one shared
+            # hash set so the full sheet is fetched once, not per file;
+            # without it each call falls back to its own fetch
+            if existing_hashes is None:
+                existing_hashes = self.get_existing_transaction_hashes()
+
+            # One pass filters against the sheet and within the batch -
+            # overlapping statements can repeat a transaction across (or
+            # within) files in the same cycle
+            seen = set()
+            new_transactions = []
+            for t in transactions:
+                key = t.get_duplicate_hash()
+                if key not in existing_hashes and key not in seen:
+                    seen.add(key)
+                    new_transactions.append(t)
+
             if not new_transactions:
                 logger.info("No new transactions to insert (all duplicates)")
                 return True
-                
+
             rows = [transaction.to_sheet_row() for transaction in new_transactions]
-            
+
             body = {
                 'values': rows
             }
-            
+
             self.service.spreadsheets().values().append(
                 spreadsheetId=Config.GOOGLE_SHEET_ID,
                 range=f"{self.sheet_range}!A:G",
@@ -127,18 +142,25 @@ class GoogleSheetsClient:
                 insertDataOption='INSERT_ROWS',
                 body=body
             ).execute()
-            
+
+            # Keep the shared set current so later files in the same
+            # cycle dedup against the rows just appended
+            existing_hashes.update(t.get_duplicate_hash() for t in new_transactions)
+
             logger.info(f"Inserted {len(new_transactions)} new transactions")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to insert transactions: {str(e)}")
             return False
     
     def verify_sheet_access(self) -> bool:
         try:
+            # Only the title is used; without the mask this returns the
+            # whole spreadsheet metadata tree including per-sheet grids
             sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=Config.GOOGLE_SHEET_ID
+                spreadsheetId=Config.GOOGLE_SHEET_ID,
+                fields='properties.title'
             ).execute()
             
             logger.info(f"Successfully connected to sheet: {sheet_metadata.get('properties', {}).get('title', 'Unknown')}")
@@ -1,6 +1,7 @@
 import logging
 import time
 import schedule
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from config import Config
 from models import ProcessedFile, ProcessingResult
@@ -15,66 +16,70 @@ class CreditCardProcessor:
         self.drive_client = GoogleDriveClient()
         self.sheets_client = GoogleSheetsClient()
         self.pdf_processor = PDFProcessor()
-        
+        # Sheet access/headers only need re-checking after a failure, not
+        # on every poll
+        self._preflight_ok = False
+        # Dedup set kept across cycles; appends maintain it in memory so
+        # steady-state cycles skip the full-sheet read entirely
+        self._existing_hashes = None
+
     def run_processing_cycle(self) -> None:
         try:
             logger.info("Starting processing cycle")
             
-            if not self.sheets_client.verify_sheet_access():
-                logger.error("Cannot access Google Sheet - aborting cycle")
-                return
-            
-            if not self.sheets_client.ensure_headers_exist():
-                logger.error("Failed to ensure headers exist - aborting cycle")
-                return
-            
+            if not self._preflight_ok:
+                if not self.sheets_client.verify_sheet_access():
+                    logger.error("Cannot access Google Sheet - aborting cycle")
+                    return
+
+                if not self.sheets_client.ensure_headers_exist():
+                    logger.error("Failed to ensure headers exist - aborting cycle")
+                    return
+
+                self._preflight_ok = True
+
             pdf_files = self.drive_client.get_pdf_files()
-            
+
             if not pdf_files:
                 logger.info("No PDF files found to process")
                 return
-                
-            processed_files = []
-            
+
+            # The sheet is only fetched when the cached set is missing or
+            # was invalidated; inserts update the set in place so later
+            # files (and cycles) dedup without another read
+            if self._existing_hashes is None:
+                self._existing_hashes = self.sheets_client.get_existing_transaction_hashes()
+            existing_hashes = self._existing_hashes
+
+            files_to_process = []
+
             for pdf_file in pdf_files:
                 if self.drive_client.file_exists_in_processed(pdf_file.filename):
                     logger.info(f"File {pdf_file.filename} already processed, skipping")
                     continue
-                
+
                 if self.drive_client.file_exists_in_failed(pdf_file.filename):
                     logger.info(f"File {pdf_file.filename} already in failed folder, skipping")
                     continue
-                
-                result = self._process_single_file(pdf_file)
-                processed_files.append(result)
-                
+
+                files_to_process.append(pdf_file)
+
+            # Downloads are network-bound and parsing mostly runs in C or
+            # in page-worker processes, so files overlap well in threads;
+            # the parsers themselves are stateless and shared safely
+            processed_files = []
+            if files_to_process:
+                max_workers = min(len(files_to_process), Config.PDF_WORKERS)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    processed_files = list(executor.map(self._process_single_file, files_to_process))
+
+            pending_inserts = []
+
+            for pdf_file, result in zip(files_to_process, processed_files):
                 if result.success and result.transactions:
-                    success = self.sheets_client.batch_insert_transactions(result.transactions)
-                    
-                    if success:
-                        moved = self.drive_client.move_to_processed_folder(
-                            pdf_file.file_id, 
-                            pdf_file.filename
-                        )
-                        
-                        if moved:
-                            logger.info(f"Successfully processed {pdf_file.filename}")
-                        else:
-                            logger.warning(f"Processed {pdf_file.filename} but failed to move to processed folder")
-                            # Move to failed folder if we can't move to processed
-                            self.drive_client.move_to_failed_folder(
-                                pdf_file.file_id,
-                                pdf_file.filename,
-                                "Failed to move to processed folder after successful processing"
-                            )
-                    else:
-                        logger.error(f"Failed to insert transactions for {pdf_file.filename}")
-                        # Move to failed folder with sheets error
-                        self.drive_client.move_to_failed_folder(
-                            pdf_file.file_id,
-                            pdf_file.filename,
-                            "Failed to insert transactions into Google Sheets"
-                        )
+                    # Collect rows for one coalesced append after the loop
+                    # instead of a Sheets round trip per file
+                    pending_inserts.append((pdf_file, result.transactions))
                 else:
                     logger.error(f"Failed to process {pdf_file.filename}: {result.error_message}")
                     # Move to failed folder with processing error
@@ -83,7 +88,12 @@ class CreditCardProcessor:
                         pdf_file.filename,
                         result.error_message or "Unknown processing error"
                     )
-            
+
+            self._insert_pending_transactions(pending_inserts, existing_hashes)
+
+            # Error rows are buffered per cycle; push them up in one go
+            self.drive_client.flush_error_log()
+
             total_transactions = sum(len(r.transactions) for r in processed_files if r.success)
             successful_files = sum(1 for r in processed_files if r.success)
             
@@ -92,6 +102,52 @@ class CreditCardProcessor:
         except Exception as e:
             logger.error(f"Processing cycle failed: {str(e)}")
     
+    def _insert_pending_transactions(self, pending_inserts, existing_hashes) -> None:
+        """Insert every file's transactions with one Sheets append, then
+        move the files according to the outcome"""
+        if not pending_inserts:
+            return
+
+        all_transactions = [t for _, transactions in pending_inserts for t in transactions]
+        success = self.sheets_client.batch_insert_transactions(all_transactions, existing_hashes)
+
+        if not success:
+            # Force the next cycle to re-verify access and headers and to
+            # rebuild the dedup set - the sheet state is now uncertain.
+            # Drop the Drive folder caches too so the next cycle re-lists
+            # the processed/failed folders (e.g. picks up files someone
+            # removed by hand for a retry)
+            self._preflight_ok = False
+            self._existing_hashes = None
+            self.drive_client.invalidate_folder_cache()
+
+        if success:
+            # One batched Drive request moves every processed file
+            move_results = self.drive_client.batch_move_to_processed(
+                [(pdf_file.file_id, pdf_file.filename) for pdf_file, _ in pending_inserts]
+            )
+
+            for pdf_file, _ in pending_inserts:
+                if move_results.get(pdf_file.filename):
+                    logger.info(f"Successfully processed {pdf_file.filename}")
+                else:
+                    logger.warning(f"Processed {pdf_file.filename} but failed to move to processed folder")
+                    # Move to failed folder if we can't move to processed
+                    self.drive_client.move_to_failed_folder(
+                        pdf_file.file_id,
+                        pdf_file.filename,
+                        "Failed to move to processed folder after successful processing"
+                    )
+        else:
+            for pdf_file, _ in pending_inserts:
+                logger.error(f"Failed to insert transactions for {pdf_file.filename}")
+                # Move to failed folder with sheets error
+                self.drive_client.move_to_failed_folder(
+                    pdf_file.file_id,
+                    pdf_file.filename,
+                    "Failed to insert transactions into Google Sheets"
+                )
+
     def _process_single_file(self, pdf_file: ProcessedFile) -> ProcessingResult:
         try:
             logger.info(f"Processing file: {pdf_file.filename}")
@@ -136,7 +192,10 @@ def main():
         
         while True:
             schedule.run_pending()
-            time.sleep(60)
+            # Sleep until the next scheduled run instead of waking every
+            # minute to find nothing due
+            idle = schedule.idle_seconds()
+            time.sleep(max(idle, 1) if idle is not None else 60)
             
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
@@ -1,12 +1,56 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
-import hashlib
+from functools import lru_cache
+from typing import Optional, List, Tuple
 import logging
+import re
+import sys
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Filename pattern: <bank>-<password>-<identifier>.pdf. The supported
+# banks are baked into the alternation, so matching validates the bank
+# in the same pass that splits the fields. Built lazily because Config
+# may be unavailable under test.
+_FILENAME_RE = None
+
+def _get_filename_re() -> 're.Pattern':
+    global _FILENAME_RE
+    if _FILENAME_RE is None:
+        try:
+            from config import Config
+            banks = Config.SUPPORTED_BANKS
+        except ImportError:
+            # Allow all banks during testing
+            banks = ['axis', 'hdfc', 'sbi', 'icici', 'rbl']
+        _FILENAME_RE = re.compile(
+            r'^(' + '|'.join(map(re.escape, banks)) + r')-([^-]+)-(.+)\.pdf$',
+            re.IGNORECASE
+        )
+    return _FILENAME_RE
+
+# Polling returns mostly the same filenames every cycle, so the parsed
+# fields are memoized on the raw name. Only the immutable pieces are
+# cached - callers mutate ProcessedFile instances (file_id, status,
+# counts), so each call still gets a fresh object.
+@lru_cache(maxsize=4096)
+def _parse_filename_cached(filename: str) -> Optional[Tuple[str, str, str]]:
+    try:
+        match = _get_filename_re().match(filename)
+
+        if not match:
+            logger.warning(f"Invalid or unsupported filename: {filename}")
+            return None
+
+        # Interned bank names are shared with the parser keys
+        bank = sys.intern(match.group(1).lower())
+        return bank, match.group(2), match.group(3)
+
+    except Exception as e:
+        logger.error(f"Error parsing filename {filename}: {str(e)}")
+        return None
+
+@dataclass(slots=True)
 class Transaction:
     date: str
     bank: str
@@ -15,13 +59,20 @@ class Transaction:
     amount: float
     category: str = ""
     processed_date: Optional[str] = None
-    
+    # Sheet row prebuilt at construction; fields are never mutated after
+    # creation, so the str(amount) conversion and tuple build happen once
+    _row: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
+        # Bank and category draw from tiny vocabularies, so interning
+        # collapses the per-instance strings to shared objects (a no-op
+        # for the parsers, which already pass interned bank names)
+        self.bank = sys.intern(self.bank)
+        if self.category:
+            self.category = sys.intern(self.category)
         if self.processed_date is None:
             self.processed_date = datetime.now().isoformat()
-    
-    def to_sheet_row(self) -> List[str]:
-        return [
+        self._row = (
             self.date,
             self.bank,
             self.txn_id,
@@ -29,11 +80,18 @@ class Transaction:
             str(self.amount),
             self.category,
             self.processed_date
-        ]
+        )
+
+    def to_sheet_row(self) -> List[str]:
+        # The Sheets API body needs a JSON array, so hand back a list copy
+        return list(self._row)
     
-    def get_duplicate_hash(self) -> str:
-        hash_string = f"{self.date}|{self.bank}|{self.txn_id}|{self.description}|{self.amount}"
-        return hashlib.md5(hash_string.encode()).hexdigest()
+    def get_duplicate_hash(self) -> Tuple[str, str, str, str, str]:
+        # A plain field tuple hashes at C speed and compares equal to the
+        # tuples built from fetched sheet rows; MD5 bought nothing since
+        # the dedup set is rebuilt in-process every run. The amount is
+        # stringified to match its spreadsheet representation.
+        return (self.date, self.bank, self.txn_id, self.description, str(self.amount))
     
     @classmethod
     def get_sheet_headers(cls) -> List[str]:
@@ -61,46 +119,22 @@ class ProcessedFile:
     
     @classmethod
     def parse_filename(cls, filename: str) -> Optional['ProcessedFile']:
-        try:
-            name_without_ext = filename.replace('.pdf', '')
-            parts = name_without_ext.split('-')
-            
-            if len(parts) < 3:
-                logger.warning(f"Invalid filename format: {filename}")
-                return None
-                
-            bank = parts[0].lower()
-            password = parts[1]
-            identifier = '-'.join(parts[2:])
-            
-            # Check bank support if config is available
-            try:
-                from config import Config
-                if bank not in Config.SUPPORTED_BANKS:
-                    logger.warning(f"Unsupported bank: {bank}")
-                    return None
-            except ImportError:
-                # Allow all banks during testing
-                supported_banks = ['axis', 'hdfc', 'sbi', 'icici', 'rbl']
-                if bank not in supported_banks:
-                    logger.warning(f"Unsupported bank: {bank}")
-                    return None
-                
-            return cls(
-                filename=filename,
-                bank=bank,
-                password=password,
-                identifier=identifier,
-                file_id="",
-                processed_at=datetime.now(),
-                transaction_count=0,
-                status="pending"
-            )
-            
-        except Exception as e:
-            logger.error(f"Error parsing filename {filename}: {str(e)}")
+        parsed = _parse_filename_cached(filename)
+        if parsed is None:
             return None
 
+        bank, password, identifier = parsed
+        return cls(
+            filename=filename,
+            bank=bank,
+            password=password,
+            identifier=identifier,
+            file_id="",
+            processed_at=datetime.now(),
+            transaction_count=0,
+            status="pending"
+        )
+
 @dataclass
 class ProcessingResult:
     file: ProcessedFile
@@ -2,29 +2,30 @@ import io
 import logging
 from typing import List, Optional
 import pdfplumber
+from bank_parsers.axis_parser import AxisParser
+from bank_parsers.hdfc_parser import HDFCParser
+from bank_parsers.sbi_parser import SBIParser
+from bank_parsers.icici_parser import ICICIParser
+from bank_parsers.rbl_parser import RBLParser
 from models import Transaction, ProcessedFile, ProcessingResult
 
 logger = logging.getLogger(__name__)
 
+# One parser instance per bank for the whole process - the parsers hold
+# no per-call state, so sharing them across PDFProcessor instances (and
+# threads) is safe
+_BANK_PARSERS = {
+    'axis': AxisParser(),
+    'hdfc': HDFCParser(),
+    'sbi': SBIParser(),
+    'icici': ICICIParser(),
+    'rbl': RBLParser()
+}
+
 class PDFProcessor:
     def __init__(self):
-        self.bank_parsers = self._load_bank_parsers()
-    
-    def _load_bank_parsers(self):
-        from bank_parsers.axis_parser import AxisParser
-        from bank_parsers.hdfc_parser import HDFCParser
-        from bank_parsers.sbi_parser import SBIParser
-        from bank_parsers.icici_parser import ICICIParser
-        from bank_parsers.rbl_parser import RBLParser
-        
-        return {
-            'axis': AxisParser(),
-            'hdfc': HDFCParser(),
-            'sbi': SBIParser(),
-            'icici': ICICIParser(),
-            'rbl': RBLParser()
-        }
-    
+        self.bank_parsers = _BANK_PARSERS
+
     def process_pdf(self, file_buffer: io.BytesIO, processed_file: ProcessedFile) -> ProcessingResult:
         try:
             logger.info(f"Processing PDF: {processed_file.filename}")
@@ -66,12 +67,15 @@ class PDFProcessor:
     
     def extract_text_content(self, pdf: pdfplumber.PDF) -> str:
         try:
-            full_text = ""
+            # Collect chunks and join once - += rebuilds the whole string
+            # every page, which goes quadratic on long statements
+            parts = []
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    full_text += page_text + "\n"
-            return full_text
+                    parts.append(page_text)
+                    parts.append("\n")
+            return "".join(parts)
         except Exception as e:
             logger.error(f"Failed to extract text content: {str(e)}")
             return ""